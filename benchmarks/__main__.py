@@ -0,0 +1,46 @@
+import argparse
+import sys
+
+from . import (  # noqa: F401
+    bench_api,
+    bench_import,
+    bench_json,
+    bench_jwt,
+    bench_rules,
+    bench_schema,
+    runner,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("pattern", nargs="?", help="only run benchmarks matching this")
+    parser.add_argument("--save", help="save results as a baseline to this file")
+    parser.add_argument("--compare", help="compare results against this baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative change to report"
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="report retained memory instead of time"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=0.2, help="seconds per repeat")
+    args = parser.parse_args()
+
+    if args.memory:
+        results = runner.run_memory(args.pattern)
+    else:
+        results = runner.run(args.pattern, args.repeat, args.budget)
+    baseline = runner.load(args.compare) if args.compare else {}
+    rows = runner.compare(baseline, results, args.threshold)
+    print(runner.report(rows, memory=args.memory))
+
+    if args.save:
+        runner.save(args.save, results)
+    if any(row[-1] == "slower" for row in rows):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+import flask
+
+from flapi import jwt, schema
+
+from .bench_schema import Person, person
+from .runner import benchmark
+
+
+def _app():
+    app = flask.Flask(__name__)
+    handler = jwt.FlaskJwt("a-secret-that-is-long-enough-for-hmac", 300, app=app)
+
+    @app.route("/people", methods=["POST"])
+    @jwt.protect(jwt.HasScopes("write:people"))
+    @schema.protect(Person)
+    def create_person(body):
+        return "", 204
+
+    @app.route("/ping", methods=["GET"])
+    def ping():
+        return "", 204
+
+    token = handler.encode({"sub": "abc", "scp": ["write:people"]})
+    return app.test_client(), {"Authorization": f"Bearer {token}"}
+
+
+@benchmark("api.baseline")
+def api_baseline():
+    client, _ = _app()
+    return lambda: client.get("/ping")
+
+
+@benchmark("api.protected.small")
+def api_protected_small():
+    client, headers = _app()
+    payload = person(1)
+    return lambda: client.post("/people", json=payload, headers=headers)
+
+
+@benchmark("api.protected.large")
+def api_protected_large():
+    client, headers = _app()
+    payload = person(200)
+    return lambda: client.post("/people", json=payload, headers=headers)
@@ -0,0 +1,29 @@
+import subprocess
+import sys
+
+from .runner import benchmark
+
+
+def _import(statement: str):
+    command = [sys.executable, "-c", statement]
+    return lambda: subprocess.check_call(command)
+
+
+@benchmark("import.python")
+def import_python():
+    return _import("pass")
+
+
+@benchmark("import.flapi")
+def import_flapi():
+    return _import("import flapi")
+
+
+@benchmark("import.flapi.schema")
+def import_schema():
+    return _import("import flapi.schema")
+
+
+@benchmark("import.flapi.jwt")
+def import_jwt():
+    return _import("import flapi.jwt")
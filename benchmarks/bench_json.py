@@ -0,0 +1,33 @@
+from flapi.core import json_backend
+
+from .bench_schema import person
+from .runner import benchmark
+
+# the payload corpus: a small body, a large body and a token's claims
+corpus = {
+    "small": person(1),
+    "large": person(100),
+    "claims": {"sub": "abc", "scp": ["read:thing", "write:thing"], "exp": 1e10},
+}
+
+
+def _register(name: str) -> None:
+    try:
+        backend = json_backend.backends[name]()
+    except ImportError:
+        return
+
+    for payload_name, payload in corpus.items():
+        text = backend.dumps(payload)
+
+        @benchmark(f"json.{name}.loads.{payload_name}")
+        def loads(text=text):
+            return lambda: backend.loads(text)
+
+        @benchmark(f"json.{name}.dumps.{payload_name}")
+        def dumps(payload=payload):
+            return lambda: backend.dumps(payload)
+
+
+for _name in json_backend.backends:
+    _register(_name)
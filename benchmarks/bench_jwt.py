@@ -0,0 +1,50 @@
+from flapi.jwt.builder import Builder
+
+from .runner import benchmark
+
+claims = {"sub": "abc", "scp": ["read:thing", "write:thing"], "name": "dave"}
+
+
+def _keys(algorithm: str):
+    if algorithm.startswith("HS"):
+        return "a-secret-that-is-long-enough-for-hmac-sha512!", None
+    try:
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ec, rsa
+    except ImportError:
+        return None, None
+    if algorithm.startswith("RS"):
+        key = rsa.generate_private_key(65537, 2048, default_backend())
+    else:
+        key = ec.generate_private_key(ec.SECP256R1(), default_backend())
+    private = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public = key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return private, public
+
+
+def _register(algorithm: str) -> None:
+    private, public = _keys(algorithm)
+    if private is None:
+        return
+
+    @benchmark(f"jwt.encode.{algorithm}")
+    def encode():
+        builder = Builder(private, 300, algorithm=algorithm)
+        return lambda: builder.encode(dict(claims))
+
+    @benchmark(f"jwt.decode.{algorithm}")
+    def decode():
+        token = Builder(private, 300, algorithm=algorithm).encode(dict(claims))
+        builder = Builder(public or private, 300, algorithm=algorithm)
+        return lambda: builder.decode(token)
+
+
+for _algorithm in ("HS256", "HS512", "RS256", "ES256"):
+    _register(_algorithm)
@@ -0,0 +1,48 @@
+from flapi.core import rules
+from flapi.jwt import HasScopes
+
+from .runner import benchmark
+
+token = {"sub": "abc", "scp": [f"read:{i}" for i in range(20)]}
+
+
+def _true(_):
+    return True
+
+
+def _false(_):
+    return False
+
+
+@benchmark("rules.single")
+def single():
+    rule = HasScopes("read:1", "read:2")
+    return lambda: rule(token)
+
+
+@benchmark("rules.wide.all_of")
+def wide_all_of():
+    rule = rules.AllOf(*(HasScopes(f"read:{i}") for i in range(20)))
+    return lambda: rule(token)
+
+
+@benchmark("rules.wide.any_of_last")
+def wide_any_of_last():
+    rule = rules.AnyOf(*([rules.Callback(_false)] * 19 + [HasScopes("read:1")]))
+    return lambda: rule(token)
+
+
+@benchmark("rules.deep")
+def deep():
+    rule = HasScopes("read:1")
+    for depth in range(20):
+        rule = (rules.AllOf if depth % 2 else rules.AnyOf)(rules.NoneOf(_false), rule)
+    return lambda: rule(token)
+
+
+@benchmark("rules.balanced")
+def balanced():
+    rule = rules.Callback(_true)
+    for _ in range(5):
+        rule = rules.AllOf(rule, rules.AnyOf(rules.Callback(_false), rule))
+    return lambda: rule(token)
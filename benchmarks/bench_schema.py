@@ -0,0 +1,237 @@
+import copy
+import datetime
+import json
+import uuid
+
+from flapi import schema
+from flapi.schema.decoding import Decoder
+from flapi.schema.encoding import Encoder
+
+from .runner import benchmark, memory
+
+
+class Address(schema.Schema):
+    number = schema.Int(min_value=0, nullable=False)
+    street = schema.String(max_length=255, nullable=False)
+    post_code = schema.Regex("[a-zA-Z]{2}[0-9] ?[0-9][a-zA-Z]{2}", nullable=False)
+
+
+class Item(schema.Schema):
+    id = schema.Uuid(nullable=False)
+    name = schema.String(min_length=3, max_length=50, nullable=False)
+    count = schema.Int(min_value=0, default=0)
+    price = schema.Float(min_value=0)
+    active = schema.Bool(default=True)
+    created_at = schema.DateTime(nullable=False)
+
+
+class Person(schema.Schema):
+    __strict__ = True
+    name = schema.String(min_length=3, max_length=50, nullable=False)
+    email = schema.Email(nullable=False)
+    address = schema.Object(Address, nullable=False, strict=True)
+    friends = schema.Array(schema.Uuid)
+    items = schema.Array(schema.Object(Item))
+    date_of_birth = schema.Date(max_value=datetime.date.today, nullable=False)
+
+
+class Node(schema.Schema):
+    name = schema.String(nullable=False)
+    value = schema.Int()
+
+
+def nested_schema(depth: int) -> schema.Property:
+    node = schema.Object(Node)
+    for _ in range(depth):
+        node = schema.Object(type("Nested", (Node,), {"child": node}))
+    return node
+
+
+def item(index: int) -> dict:
+    return {
+        "id": str(uuid.UUID(int=index)),
+        "name": f"item {index}",
+        "count": index,
+        "price": index / 3,
+        "active": index % 2 == 0,
+        "created_at": "2019-01-01T12:30:00.000000+01:00",
+    }
+
+
+def person(items: int) -> dict:
+    return {
+        "name": "dave",
+        "email": "dave@example.com",
+        "address": {"number": 12, "street": "some street", "post_code": "AB1 2CD"},
+        "friends": [str(uuid.UUID(int=i)) for i in range(items)],
+        "items": [item(i) for i in range(items)],
+        "date_of_birth": "1970-01-01",
+    }
+
+
+def nested(depth: int) -> dict:
+    value = {"name": "leaf", "value": 0}
+    for level in range(depth):
+        value = {"name": f"level {level}", "value": level, "child": value}
+    return value
+
+
+def _validate(prop, payload):
+    # validators replace array items in place, so each run gets a fresh copy
+    return lambda: prop(copy.deepcopy(payload))
+
+
+@benchmark("schema.copy.small")
+def copy_small():
+    payload = person(1)
+    return lambda: copy.deepcopy(payload)
+
+
+@benchmark("schema.person.small")
+def person_small():
+    return _validate(Person(), person(1))
+
+
+@benchmark("schema.copy.large")
+def copy_large():
+    payload = person(500)
+    return lambda: copy.deepcopy(payload)
+
+
+@benchmark("schema.person.large")
+def person_large():
+    return _validate(Person(), person(500))
+
+
+@benchmark("schema.loads.person.large")
+def loads_person_large():
+    prop = Person()
+    text = json.dumps(person(100))
+    return lambda: prop(json.loads(text))
+
+
+@benchmark("schema.decode.person.large")
+def decode_person_large():
+    decoder = Decoder(Person())
+    text = json.dumps(person(100))
+    return lambda: decoder.decode(text)
+
+
+@benchmark("schema.dumps.person.large")
+def dumps_person_large():
+    value = Person()(person(100))
+    return lambda: json.dumps(value, default=str)
+
+
+@benchmark("schema.encode.person.large")
+def encode_person_large():
+    encoder = Encoder(Person)
+    value = Person()(person(100))
+    return lambda: encoder.encode(value)
+
+
+@benchmark("schema.nested.deep")
+def nested_deep():
+    return _validate(nested_schema(50), nested(50))
+
+
+@benchmark("schema.array.numbers")
+def array_numbers():
+    payload = [i / 1000 for i in range(1000)]
+    return _validate(schema.Array(schema.Float(min_value=0, max_value=1)), payload)
+
+
+@benchmark("schema.array.numbers.packed")
+def array_numbers_packed():
+    prop = schema.Array(schema.Float(min_value=0, max_value=1), packed=True)
+    payload = [i / 1000 for i in range(1000)]
+    return _validate(prop, payload)
+
+
+@benchmark("schema.leaf.string")
+def leaf_string():
+    prop = schema.String(max_length=255)
+    return lambda: prop("some string")
+
+
+@benchmark("schema.leaf.datetime")
+def leaf_datetime():
+    prop = schema.DateTime()
+    return lambda: prop("2019-01-01T12:30:00.000000+01:00")
+
+
+@memory("schema.memory.properties")
+def memory_properties():
+    return lambda: [
+        prop
+        for _ in range(1000)
+        for prop in (
+            schema.String(max_length=255),
+            schema.Int(min_value=0),
+            schema.Float(),
+            schema.Bool(),
+            schema.Uuid(),
+            schema.Email(),
+            schema.Date(),
+            schema.DateTime(),
+            schema.Array(schema.Int()),
+        )
+    ]
+
+
+@memory("schema.memory.nested")
+def memory_nested():
+    return lambda: nested_schema(200)
+
+
+def _schemas():
+    # repeated leaf definitions, as found across the schemas of a large app
+    schemas = []
+    for index in range(200):
+        fields = {
+            "id": schema.Uuid(nullable=False),
+            "name": schema.String(max_length=255),
+            "count": schema.Int(min_value=0),
+            "email": schema.Email(),
+            "created_at": schema.DateTime(nullable=False),
+            "tags": schema.Array(schema.String(max_length=255)),
+        }
+        schemas.append(type(f"Generated{index}", (schema.Schema,), fields)())
+    return schemas
+
+
+@memory("schema.memory.schemas")
+def memory_schemas():
+    return _schemas
+
+
+@memory("schema.memory.items.dicts")
+def memory_item_dicts():
+    prop = schema.Array(schema.Object(Item))
+    payload = [item(i) for i in range(10000)]
+    return lambda: prop(copy.deepcopy(payload))
+
+
+@memory("schema.memory.items.records")
+def memory_item_records():
+    prop = schema.Array(schema.Object(Item, record=True))
+    payload = [item(i) for i in range(10000)]
+    return lambda: prop(copy.deepcopy(payload))
+
+
+@benchmark("schema.array.rows")
+def array_rows():
+    return _validate(schema.Array(schema.Object(Item)), [item(i) for i in range(500)])
+
+
+@benchmark("schema.array.columnar")
+def array_columnar():
+    prop = schema.Array(schema.Object(Item), columnar=True)
+    return _validate(prop, [item(i) for i in range(500)])
+
+
+@memory("schema.memory.items.columnar")
+def memory_item_columnar():
+    prop = schema.Array(schema.Object(Item), columnar=True)
+    payload = [item(i) for i in range(10000)]
+    return lambda: prop(copy.deepcopy(payload))
@@ -0,0 +1,155 @@
+import json
+import platform
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+Benchmark = Callable[[], Callable[[], object]]
+
+registry: Dict[str, Benchmark] = {}
+memory_registry: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """
+    registers a setup function, which returns the callable to be timed
+    """
+
+    def decorator(setup: Benchmark) -> Benchmark:
+        if name in registry:
+            raise ValueError(f"benchmark {name} is already registered")
+        registry[name] = setup
+        return setup
+
+    return decorator
+
+
+def memory(name: str) -> Callable[[Benchmark], Benchmark]:
+    """
+    registers a setup function, which returns a callable measured as the bytes
+    retained by what it returns
+    """
+
+    def decorator(setup: Benchmark) -> Benchmark:
+        if name in memory_registry:
+            raise ValueError(f"memory benchmark {name} is already registered")
+        memory_registry[name] = setup
+        return setup
+
+    return decorator
+
+
+def allocated(build: Callable[[], object]) -> int:
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        built = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    del built
+    return after - before
+
+
+def measure(func: Callable[[], object], repeat: int = 5, budget: float = 0.2) -> float:
+    timer = timeit.Timer(func)
+    number, took = timer.autorange()
+    number = max(1, int(number * budget / max(took, 1e-9)))
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(
+    pattern: Optional[str] = None, repeat: int = 5, budget: float = 0.2
+) -> Dict[str, float]:
+    results = {}
+    for name in sorted(registry):
+        if pattern is not None and pattern not in name:
+            continue
+        results[name] = measure(registry[name](), repeat, budget)
+    return results
+
+
+def run_memory(pattern: Optional[str] = None) -> Dict[str, float]:
+    results = {}
+    for name in sorted(memory_registry):
+        if pattern is not None and pattern not in name:
+            continue
+        results[name] = allocated(memory_registry[name]())
+    return results
+
+
+def save(path: str, results: Dict[str, float]) -> None:
+    with open(path, "w") as stream:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            },
+            stream,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+def load(path: str) -> Dict[str, float]:
+    with open(path) as stream:
+        return json.load(stream)["results"]
+
+
+def compare(
+    baseline: Dict[str, float], results: Dict[str, float], threshold: float = 0.1
+) -> List[Tuple[str, Optional[float], float, Optional[float], str]]:
+    rows = []
+    for name, current in sorted(results.items()):
+        previous = baseline.get(name, None)
+        if previous is None:
+            rows.append((name, None, current, None, "new"))
+            continue
+        change = current / previous - 1
+        status = "ok"
+        if change > threshold:
+            status = "slower"
+        elif change < -threshold:
+            status = "faster"
+        rows.append((name, previous, current, change, status))
+    return rows
+
+
+def _format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def _format_bytes(size: Optional[float]) -> str:
+    if size is None:
+        return "-"
+    for unit, scale in (("MB", 1 << 20), ("KB", 1 << 10)):
+        if size >= scale:
+            return f"{size / scale:.2f}{unit}"
+    return f"{size:.0f}B"
+
+
+def report(
+    rows: List[Tuple[str, Optional[float], float, Optional[float], str]],
+    memory: bool = False,
+) -> str:
+    formatter = _format_bytes if memory else _format_time
+    width = max([len(row[0]) for row in rows] + [9])
+    lines = [
+        f"{'benchmark':<{width}}  {'baseline':>10}  {'current':>10}  {'change':>8}"
+    ]
+    for name, previous, current, change, status in rows:
+        change_text = "-" if change is None else f"{change:+.1%}"
+        lines.append(
+            f"{name:<{width}}  {formatter(previous):>10}  "
+            f"{formatter(current):>10}  {change_text:>8}  {status}"
+        )
+    return "\n".join(lines)
@@ -1,6 +1,37 @@
-from . import schema as _schema, jwt as _jwt, core as _core
+import importlib
+import sys
 
-rules = _core.rules
+_lazy = {
+    "schema": "flapi.schema",
+    "jwt": "flapi.jwt",
+    "core": "flapi.core",
+    "rules": "flapi.core.rules",
+}
+_lazy_attributes = {"warmup": ("flapi.core.warmup", "warmup")}
 
-schema = _schema
-jwt = _jwt
+
+def __getattr__(name: str):
+    if name in _lazy_attributes:
+        module_name, attribute = _lazy_attributes[name]
+        value = getattr(importlib.import_module(module_name), attribute)
+    elif name in _lazy:
+        value = importlib.import_module(_lazy[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy) | set(_lazy_attributes))
+
+
+if sys.version_info < (3, 7):  # module __getattr__ (PEP 562) requires 3.7
+    from . import schema as _schema, jwt as _jwt, core as _core
+    from .core import warmup as _warmup
+
+    rules = _core.rules
+    warmup = _warmup.warmup
+
+    schema = _schema
+    jwt = _jwt
@@ -1,3 +1,11 @@
-from . import rules as _rules
+from . import (
+    json_backend as _json_backend,
+    metrics as _metrics,
+    rules as _rules,
+    tracing as _tracing,
+)
 
+json_backend = _json_backend
+metrics = _metrics
 rules = _rules
+tracing = _tracing
@@ -0,0 +1,102 @@
+import importlib
+import json
+from typing import Any, Callable, Optional, Type, Union
+
+
+class Backend:
+    """
+    the standard library json module, used unless another backend is set
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any, default: Optional[Callable] = None) -> str:
+        return json.dumps(value, separators=(",", ":"), default=default)
+
+
+class OrjsonBackend(Backend):
+    """
+    orjson, which raises json.JSONDecodeError subclasses like the stdlib
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        self.orjson = importlib.import_module("orjson")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self.orjson.loads(data)
+
+    def dumps(self, value: Any, default: Optional[Callable] = None) -> str:
+        return self.orjson.dumps(value, default=default).decode("utf8")
+
+
+backends = {"json": Backend, "orjson": OrjsonBackend}
+
+backend: Backend = Backend()
+
+_missing = object()
+
+
+def set_backend(new_backend: Union[str, Backend]) -> Backend:
+    """
+    sets the backend by name or instance. "auto" picks orjson if it is
+    installed, falling back to the standard library
+    """
+    global backend
+    if new_backend == "auto":
+        try:
+            new_backend = OrjsonBackend()
+        except ImportError:
+            new_backend = Backend()
+    elif isinstance(new_backend, str):
+        if new_backend not in backends:
+            raise ValueError(f"unknown json backend {new_backend}")
+        new_backend = backends[new_backend]()
+    backend = new_backend
+    return backend
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    return backend.loads(data)
+
+
+def dumps(value: Any, default: Optional[Callable] = None) -> str:
+    return backend.dumps(value, default)
+
+
+class _Encoder(json.JSONEncoder):
+    def encode(self, value: Any) -> str:
+        return backend.dumps(value, self.default)
+
+
+def encoder_class() -> Optional[Type[json.JSONEncoder]]:
+    """
+    a json.JSONEncoder for libraries taking one (eg. pyjwt), encoding with the
+    backend, or None when the standard library is used anyway
+    """
+    return None if type(backend) is Backend else _Encoder
+
+
+def request_json(request: Any) -> Any:
+    """
+    the json body of a flask request. the standard library backend leaves
+    this to flask, others parse the body once per request, failing the same
+    way flask does
+    """
+    if type(backend) is Backend:
+        return request.json
+    cached = getattr(request, "_flapi_json", _missing)
+    if cached is not _missing:
+        return cached
+    value = None
+    if request.is_json:
+        try:
+            value = backend.loads(request.get_data(cache=True))
+        except ValueError as ex:
+            value = request.on_json_loading_failed(ex)
+    request._flapi_json = value
+    return value
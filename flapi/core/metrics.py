@@ -0,0 +1,216 @@
+import bisect
+import collections
+import threading
+import time
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = _labels(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels: Any) -> float:
+        return self.values.get(_labels(labels), 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.values = {}
+
+    def samples(self) -> List[Tuple[str, Labels, float]]:
+        return [(self.name, key, value) for key, value in sorted(self.values.items())]
+
+
+class _Series:
+    def __init__(self, buckets: int, window: int):
+        self.counts = [0] * buckets
+        self.sum = 0.0
+        self.count = 0
+        self.recent: Deque[float] = collections.deque(maxlen=window)
+
+
+class Histogram:
+    type = "histogram"
+    buckets = (
+        0.00001,
+        0.000025,
+        0.00005,
+        0.0001,
+        0.00025,
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+    )
+    quantiles = (0.5, 0.99)
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        buckets: Optional[Tuple[float, ...]] = None,
+        window: int = 1024,
+    ):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets or self.buckets)
+        self.window = window
+        self.series: Dict[Labels, _Series] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = _labels(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self.series.get(key, None)
+            if series is None:
+                series = self.series[key] = _Series(len(self.buckets), self.window)
+            if index < len(self.buckets):
+                series.counts[index] += 1
+            series.sum += value
+            series.count += 1
+            series.recent.append(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.series = {}
+
+    def observe_since(self, started: Optional[float], **labels: Any) -> None:
+        if started is not None:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def quantile(self, quantile: float, **labels: Any) -> Optional[float]:
+        with self._lock:
+            series = self.series.get(_labels(labels), None)
+            recent = sorted(series.recent) if series is not None else None
+        if not recent:
+            return None
+        return recent[min(len(recent) - 1, int(quantile * len(recent)))]
+
+    def samples(self) -> List[Tuple[str, Labels, float]]:
+        samples = []
+        with self._lock:
+            items = sorted(self.series.items())
+        for key, series in items:
+            cumulative = 0
+            for bucket, count in zip(self.buckets, series.counts):
+                cumulative += count
+                samples.append(
+                    (f"{self.name}_bucket", key + (("le", repr(bucket)),), cumulative)
+                )
+            samples.append(
+                (f"{self.name}_bucket", key + (("le", "+Inf"),), series.count)
+            )
+            samples.append((f"{self.name}_sum", key, series.sum))
+            samples.append((f"{self.name}_count", key, series.count))
+        return samples
+
+    def quantile_samples(self) -> List[Tuple[str, Labels, float]]:
+        samples = []
+        with self._lock:
+            keys = sorted(self.series)
+        for key in keys:
+            labels = dict(key)
+            for quantile in self.quantiles:
+                value = self.quantile(quantile, **labels)
+                if value is not None:
+                    samples.append(
+                        (
+                            f"{self.name}_quantile",
+                            key + (("quantile", str(quantile)),),
+                            value,
+                        )
+                    )
+        return samples
+
+
+class Registry:
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.metrics: Dict[str, Union[Counter, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls: type, name: str, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            metric = self.metrics.get(name, None)
+            if metric is None:
+                metric = self.metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(
+                    f"metric {name} is already registered as a {metric.type}"
+                )
+            return metric
+
+    def counter(self, name: str, description: str) -> Counter:
+        return self._get(Counter, name, description)
+
+    def histogram(self, name: str, description: str, **kwargs: Any) -> Histogram:
+        return self._get(Histogram, name, description, **kwargs)
+
+    def clock(self) -> Optional[float]:
+        return time.perf_counter() if self.enabled else None
+
+    def clear(self) -> None:
+        with self._lock:
+            for metric in self.metrics.values():
+                metric.clear()
+
+    def render(self) -> str:
+        lines = []
+        for name, metric in sorted(self.metrics.items()):
+            lines.append(f"# HELP {name} {metric.description}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            for sample, labels, value in metric.samples():
+                lines.append(f"{sample}{_format_labels(labels)} {value!r}")
+            if isinstance(metric, Histogram):
+                quantiles = metric.quantile_samples()
+                if quantiles:
+                    lines.append(f"# TYPE {name}_quantile gauge")
+                for sample, labels, value in quantiles:
+                    lines.append(f"{sample}{_format_labels(labels)} {value!r}")
+        return "\n".join(lines) + "\n"
+
+    def view(self) -> Tuple[str, int, Dict[str, str]]:
+        return self.render(), 200, {"Content-Type": self.content_type}
+
+    def init_app(self, app: Any, rule: str = "/metrics", enable: bool = True) -> None:
+        app.add_url_rule(rule, "flapi_metrics", self.view, methods=["GET"])
+        if enable:
+            self.enabled = True
+
+
+registry = Registry()
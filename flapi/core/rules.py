@@ -2,9 +2,15 @@ from typing import Callable, Dict
 
 
 class Rule:
+
+    __slots__ = ()
+
     def __call__(self, item: Dict) -> bool:
         raise NotImplementedError
 
+    def compile(self) -> "Rule":
+        return self
+
 
 class _CollectionRule(Rule):
     def __init__(self, *rules: Rule):
@@ -13,6 +19,18 @@ class _CollectionRule(Rule):
     def __call__(self, item: Dict) -> bool:
         raise NotImplementedError
 
+    def compile(self) -> "_CollectionRule":
+        rules = []
+        for rule in self.rules:
+            if isinstance(rule, Rule):
+                rule.compile()
+            if type(rule) is type(self) and type(self) in (AnyOf, AllOf):
+                rules.extend(rule.rules)
+            else:
+                rules.append(rule)
+        self.rules = tuple(rules)
+        return self
+
 
 class AnyOf(_CollectionRule):
     def __call__(self, item: Dict) -> bool:
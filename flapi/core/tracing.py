@@ -0,0 +1,91 @@
+import contextlib
+import functools
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional
+
+
+class Span:
+    def __init__(self, name: str, attributes: Dict[str, Any], parent: "Span" = None):
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.error: Optional[BaseException] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        return None if self.end is None else self.end - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class Tracer:
+    def span(self, name: str, **attributes: Any) -> ContextManager:
+        raise NotImplementedError
+
+
+class InMemoryTracer(Tracer):
+    """
+    keeps finished spans in memory, intended for tests
+    """
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        parent = getattr(self._local, "current", None)
+        span = self._local.current = Span(name, attributes, parent)
+        try:
+            yield span
+        except BaseException as ex:
+            span.error = ex
+            raise
+        finally:
+            span.end = time.perf_counter()
+            self._local.current = parent
+            self.spans.append(span)
+
+    def names(self) -> List[str]:
+        return [span.name for span in self.spans]
+
+    def clear(self) -> None:
+        self.spans = []
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    adapts an opentelemetry tracer, eg. OpenTelemetryTracer(trace.get_tracer("flapi"))
+    """
+
+    def __init__(self, tracer: Any):
+        self.tracer = tracer
+
+    def span(self, name: str, **attributes: Any) -> ContextManager:
+        return self.tracer.start_as_current_span(name, attributes=attributes)
+
+
+tracer: Optional[Tracer] = None
+
+
+def set_tracer(new_tracer: Optional[Tracer]) -> None:
+    global tracer
+    tracer = new_tracer
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,34 @@
+import gc
+from typing import Any, Callable, List
+
+
+def protections(view: Callable) -> List[Any]:
+    found = []
+    while view is not None:
+        protect = (
+            view.__dict__.get("flapi_protect", None)
+            if hasattr(view, "__dict__")
+            else None
+        )
+        if protect is not None and all(protect is not seen for seen in found):
+            found.append(protect)
+        view = getattr(view, "__wrapped__", None)
+    return found
+
+
+def warmup(app: Any, freeze: bool = True) -> int:
+    """
+    compiles the schema and rule state of every protected view, then moves every
+    tracked object into the gc's permanent generation so forked workers share them.
+    call once the app is fully built, before workers fork
+    """
+    compiled = 0
+    for view in app.view_functions.values():
+        for protect in protections(view):
+            protect.compile()
+            compiled += 1
+    if freeze:
+        gc.collect()
+        if hasattr(gc, "freeze"):
+            gc.freeze()
+    return compiled
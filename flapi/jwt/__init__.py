@@ -1,10 +1,27 @@
-from . import app as _app, protect as _route, rules as _rules, errors as _errors
+from . import (
+    app as _app,
+    audit as _audit,
+    protect as _route,
+    rules as _rules,
+    errors as _errors,
+    limit as _limit,
+    revocation as _revocation,
+    shared as _shared,
+)
 
 FlaskJwt = _app.FlaskJwt
 current_token = FlaskJwt.current_token
 
 protect = _route.Protect
 
+RevocationList = _revocation.RevocationList
+SharedTokenCache = _shared.SharedTokenCache
+
+RateLimit = _limit.RateLimit
+SharedBuckets = _limit.SharedBuckets
+
+AuditLog = _audit.AuditLog
+
 JWTRule = _rules.JwtRule
 HasScopes = _rules.HasScopes
 MatchValue = _rules.MatchValue
@@ -16,3 +33,4 @@ NoneOf = _rules.NoneOf
 JWTEncodeError = _errors.JWTEncodeError
 JWTDecodeError = _errors.JWTDecodeError
 JWTValidationError = _errors.JWTValidationError
+JWTRateLimitError = _errors.JWTRateLimitError
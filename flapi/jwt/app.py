@@ -1,8 +1,9 @@
-from typing import Any
+from typing import Any, Callable, Dict, Optional
 
 import flask
 
-from . import builder, errors
+from . import audit, builder, errors, shared
+from ..core import tracing
 
 
 class FlaskJwt(builder.Builder):
@@ -10,6 +11,7 @@ class FlaskJwt(builder.Builder):
     header_key = "Authorization"
     token_prefix = "Bearer "
     validation_error = errors.JWTValidationError
+    rate_limit_error = errors.JWTRateLimitError
 
     def __init__(
         self,
@@ -18,11 +20,19 @@ class FlaskJwt(builder.Builder):
         app=None,
         verify: bool = True,
         auto_update: bool = False,
+        revocation: Optional[Callable[[Dict], bool]] = None,
+        decode_cache: Optional[shared.SharedTokenCache] = None,
+        rate_limit: Optional[Callable[[Dict], bool]] = None,
+        audit: Optional[audit.AuditLog] = None,
         **kwargs: Any,
     ):
         super(FlaskJwt, self).__init__(secret, lifespan, **kwargs)
         self.verify = verify
         self.auto_update = auto_update
+        self.revocation = revocation
+        self.decode_cache = decode_cache
+        self.rate_limit = rate_limit
+        self.audit = audit
         self.app = None
 
         self.init_app(app)
@@ -33,6 +43,7 @@ class FlaskJwt(builder.Builder):
             app.after_request(self.post_request_callback)
         self.app = app
 
+    @tracing.traced("flapi.jwt.pre_request")
     def pre_request_callback(self) -> None:
         prefix = self.token_prefix
         token_string = flask.request.headers.get(self.header_key, None)
@@ -40,15 +51,34 @@ class FlaskJwt(builder.Builder):
             if not token_string.startswith(prefix) or len(token_string) <= len(prefix):
                 raise self.validation_error("invalid bearer token")
             token_string = token_string[len(prefix) :]
-            decoded = self.decode(token_string, self.verify)
+            decoded = self.decode_request_token(token_string)
+            if self.revocation is not None and self.revocation(decoded):
+                raise self.validation_error("token has been revoked")
+            if self.rate_limit is not None and not self.rate_limit(decoded):
+                raise self.rate_limit_error("rate limit exceeded")
             self.store.set(decoded)
         else:
             self.store.set(None)
 
+    def decode_request_token(self, token_string: str) -> Dict:
+        if self.decode_cache is None or not self.verify:
+            return self.decode(token_string, self.verify)
+        decoded = self.decode_cache.get(token_string)
+        if decoded is None:
+            decoded = self.decode(token_string, self.verify)
+            self.decode_cache.set(token_string, decoded)
+        return decoded
+
+    @tracing.traced("flapi.jwt.post_request")
     def post_request_callback(self, response: flask.Response) -> flask.Response:
+        token_dict = self.store.get()
+        if self.audit is not None and token_dict:
+            request = flask.request
+            self.audit.record(
+                token_dict, request.method, request.path, response.status_code
+            )
         if self.auto_update:
             prefix = self.token_prefix
-            token_dict = self.store.get()
             if token_dict:
                 encoded = self.encode(token_dict)
                 response.headers.set(self.header_key, f"{prefix}{encoded}")
@@ -0,0 +1,146 @@
+import collections
+import logging
+import os
+import threading
+import time
+from typing import Deque, Dict, Optional, Tuple
+
+from ..core import json_backend
+
+logger = logging.getLogger(__name__)
+
+
+class AuditLog:
+    """
+    records token usage without blocking requests.
+    records are queued in memory and written in batches to a rotating file by a
+    background thread, when the queue is full new records are dropped and counted.
+    batches that fail to be written are put back on the queue and retried
+    """
+
+    fields = ("time", "sub", "jti", "method", "path", "status")
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+        flush_interval: float = 1.0,
+        batch_size: int = 1000,
+        max_queue: int = 100000,
+        encoding: str = "utf8",
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_queue = max_queue
+        self.encoding = encoding
+
+        self.queue: Deque[Tuple] = collections.deque()
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._write_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def _ensure_writer(self) -> None:
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def record(
+        self, token: Dict, method: str, path: str, status: Optional[int] = None
+    ) -> bool:
+        if len(self.queue) >= self.max_queue:
+            self.dropped += 1
+            return False
+        self.queue.append(
+            (
+                time.time(),
+                token.get("sub", None),
+                token.get("jti", None),
+                method,
+                path,
+                status,
+            )
+        )
+        self.recorded += 1
+        self._ensure_writer()
+        if len(self.queue) >= self.batch_size:
+            self._wake.set()
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("failed to write audit records")
+
+    def _rotate(self) -> None:
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def _write(self, data: bytes) -> None:
+        if (
+            self.max_bytes
+            and os.path.exists(self.path)
+            and 0 < os.path.getsize(self.path)
+            and os.path.getsize(self.path) + len(data) > self.max_bytes
+        ):
+            self._rotate()
+        with open(self.path, "ab") as stream:
+            stream.write(data)
+
+    def flush(self) -> int:
+        with self._write_lock:
+            written = 0
+            while self.queue:
+                batch = []
+                while self.queue and len(batch) < self.batch_size:
+                    batch.append(self.queue.popleft())
+                lines = [
+                    json_backend.dumps(dict(zip(self.fields, record)))
+                    for record in batch
+                ]
+                try:
+                    self._write(("\n".join(lines) + "\n").encode(self.encoding))
+                except OSError:
+                    # keep the batch, in order, for the next flush
+                    self.queue.extendleft(reversed(batch))
+                    self.failed += len(batch)
+                    raise
+                written += len(batch)
+                self.written += len(batch)
+            return written
+
+    def close(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join()
+        self._thread = None
+        self._pid = None
+        self.flush()
@@ -2,7 +2,8 @@ import json
 import time
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from . import coder, store
+from . import cache, coder, store
+from ..core import tracing
 
 
 class Builder:
@@ -19,6 +20,7 @@ class Builder:
         issuer: Union[str, List[str], Callable] = None,
         audience: Union[str, List[str], Callable] = None,
         json_encoder: Optional[json.JSONEncoder] = None,
+        token_refresh: float = 0.75,
     ):
         self.secret = secret
         self.lifespan = lifespan
@@ -26,6 +28,7 @@ class Builder:
         self.issuer = issuer if not callable(issuer) else issuer()
         self.audience = audience if not callable(audience) else audience()
         self.json_encoder = json_encoder
+        self.token_cache = cache.TokenCache(self, token_refresh)
 
     def encode(
         self,
@@ -47,6 +50,7 @@ class Builder:
         )
         return token_bytes.decode(self.encoding)
 
+    @tracing.traced("flapi.jwt.decode")
     def decode(
         self,
         jwt_string: str,
@@ -65,6 +69,11 @@ class Builder:
             audience=self.audience,
         )
 
+    def service_token(
+        self, subject: str, scopes: Union[List, Tuple] = (), audience: str = None
+    ) -> str:
+        return self.token_cache.get(subject, scopes, audience)
+
     @classmethod
     def current_token(cls) -> Union[Dict, None]:
         return cls.store.get()
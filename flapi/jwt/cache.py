@@ -0,0 +1,93 @@
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from . import shared
+from ..core import metrics
+
+
+class _Entry:
+
+    __slots__ = ("token", "refresh_at", "expires_at")
+
+    def __init__(self, token: str, refresh_at: float, expires_at: float):
+        self.token = token
+        self.refresh_at = refresh_at
+        self.expires_at = expires_at
+
+
+class TokenCache:
+    def __init__(self, builder: Any, refresh_ratio: float = 0.75, background=True):
+        if not 0 < refresh_ratio <= 1:
+            raise ValueError("refresh_ratio must be greater than 0 and at most 1")
+        self.builder = builder
+        self.refresh_ratio = refresh_ratio
+        self.background = background
+        self._entries: Dict[Tuple, _Entry] = {}
+        self._locks: Dict[Tuple, threading.Lock] = {}
+        self._pending: Set[Tuple] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(
+        subject: str, scopes: Iterable[str], audience: Optional[str]
+    ) -> Tuple[Optional[str], Tuple[str, ...], str]:
+        return audience, tuple(sorted(scopes)), subject
+
+    def _mint(self, key: Tuple) -> _Entry:
+        audience, scopes, subject = key
+        lifespan = self.builder.lifespan
+        now = time.time()
+        token = {"sub": subject, "scp": list(scopes), "iat": now}
+        if audience is not None:
+            token["aud"] = audience
+        encoded = self.builder.encode(token, lifespan=lifespan)
+        return _Entry(encoded, now + lifespan * self.refresh_ratio, now + lifespan)
+
+    def _refresh(self, key: Tuple, stale: Optional[_Entry]) -> _Entry:
+        lock = self._locks.get(key) or self._locks.setdefault(key, threading.Lock())
+        with lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry is not stale:
+                return entry
+            entry = self._mint(key)
+            self._entries[key] = entry
+            return entry
+
+    def _refresh_in_background(self, key: Tuple, stale: _Entry) -> None:
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+
+        def _run() -> None:
+            try:
+                self._refresh(key, stale)
+            except self.builder.coder.encode_error:
+                pass
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+
+        threading.Thread(target=_run, daemon=True).start()
+
+    def get(
+        self, subject: str, scopes: Iterable[str] = (), audience: Optional[str] = None
+    ) -> str:
+        key = self._key(subject, scopes, audience)
+        entry = self._entries.get(key)
+        now = time.time()
+        if metrics.registry.enabled:
+            result = "hit" if entry is not None and now < entry.expires_at else "miss"
+            shared.cache_total.inc(cache="service", result=result)
+        if entry is not None:
+            if now < entry.refresh_at:
+                return entry.token
+            if self.background and now < entry.expires_at:
+                self._refresh_in_background(key, entry)
+                return entry.token
+        return self._refresh(key, entry).token
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
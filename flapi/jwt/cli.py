@@ -0,0 +1,156 @@
+import argparse
+import multiprocessing
+import sys
+import time
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+from . import builder
+from ..core import json_backend
+
+_builder: Optional[builder.Builder] = None
+_options: Optional[Dict] = None
+
+
+def _init_worker(settings: Dict[str, Any], options: Optional[Dict]) -> None:
+    global _builder, _options
+    _builder = builder.Builder(**settings)
+    _options = options
+
+
+def _verify(item: Tuple[int, str]) -> Dict[str, Any]:
+    line, token = item
+    decode_error = _builder.coder.decode_error
+    try:
+        claims = _builder.decode(token, True, options=_options)
+        return {"line": line, "valid": True, "claims": claims, "error": None}
+    except decode_error as ex:
+        reason = str(ex)
+    try:
+        claims = _builder.decode(token, False)
+    except decode_error:
+        claims = None
+    return {"line": line, "valid": False, "claims": claims, "error": reason}
+
+
+def _read_tokens(streams: Iterable[IO], prefix: str) -> Iterator[Tuple[int, str]]:
+    line = 0
+    for stream in streams:
+        for raw in stream:
+            line += 1
+            token = raw.strip()
+            if token.startswith(prefix):
+                token = token[len(prefix) :].strip()
+            if token:
+                yield line, token
+
+
+def _open_inputs(paths: List[str]) -> Iterator[IO]:
+    if not paths:
+        paths = ["-"]
+    for path in paths:
+        if path == "-":
+            yield sys.stdin
+        else:
+            with open(path, "r", encoding=builder.Builder.encoding) as stream:
+                yield stream
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="flapi-verify",
+        description="verify and decode bearer tokens, writing results as ndjson",
+    )
+    parser.add_argument("files", nargs="*", help="token files, '-' for stdin")
+    secret = parser.add_mutually_exclusive_group(required=True)
+    secret.add_argument("--secret", help="secret or public key used to verify")
+    secret.add_argument("--secret-file", help="file containing the secret or key")
+    parser.add_argument("--algorithm", default="HS256")
+    parser.add_argument("--issuer", default=None)
+    parser.add_argument("--audience", default=None)
+    parser.add_argument(
+        "--ignore-expiry", action="store_true", help="do not reject expired tokens"
+    )
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--output", default="-", help="output file, '-' for stdout")
+    return parser
+
+
+def run(
+    streams: Iterable[IO],
+    output: IO,
+    settings: Dict[str, Any],
+    options: Optional[Dict] = None,
+    processes: Optional[int] = None,
+    chunk_size: int = 1024,
+) -> Dict[str, Any]:
+    tokens = _read_tokens(streams, "Bearer ")
+    stats = {"total": 0, "valid": 0, "invalid": 0}
+    started = time.perf_counter()
+
+    if processes == 1:
+        _init_worker(settings, options)
+        results = map(_verify, tokens)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes, _init_worker, (settings, options))
+        results = pool.imap(_verify, tokens, chunksize=chunk_size)
+
+    try:
+        for result in results:
+            stats["total"] += 1
+            stats["valid" if result["valid"] else "invalid"] += 1
+            output.write(json_backend.dumps(result, default=str))
+            output.write("\n")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    stats["seconds"] = time.perf_counter() - started
+    stats["per_second"] = stats["total"] / stats["seconds"] if stats["seconds"] else 0
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+
+    secret = args.secret
+    if args.secret_file is not None:
+        with open(args.secret_file, "r", encoding=builder.Builder.encoding) as stream:
+            secret = stream.read()
+
+    settings = {
+        "secret": secret,
+        "lifespan": 0,
+        "algorithm": args.algorithm,
+        "issuer": args.issuer,
+        "audience": args.audience,
+    }
+    options = {"verify_exp": False} if args.ignore_expiry else None
+
+    output = sys.stdout
+    if args.output != "-":
+        output = open(args.output, "w", encoding=builder.Builder.encoding)
+    try:
+        stats = run(
+            _open_inputs(args.files),
+            output,
+            settings,
+            options,
+            args.processes,
+            args.chunk_size,
+        )
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    sys.stderr.write(
+        f"{stats['total']} tokens ({stats['valid']} valid, {stats['invalid']} invalid) "
+        f"in {stats['seconds']:.2f}s, {stats['per_second']:.0f} tokens/s\n"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
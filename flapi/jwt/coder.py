@@ -4,6 +4,14 @@ from typing import Any, Dict, List, Optional
 import jwt
 
 from . import errors
+from ..core import json_backend, metrics
+
+decode_seconds = metrics.registry.histogram(
+    "flapi_jwt_decode_seconds", "time spent decoding and verifying tokens"
+)
+decode_total = metrics.registry.counter(
+    "flapi_jwt_decode_total", "decoded tokens by result"
+)
 
 
 class Coder:
@@ -21,12 +29,20 @@ class Coder:
         options: Optional[Dict] = None,
         **validate: Any,
     ) -> Dict:
+        started = metrics.registry.clock()
         try:
-            return jwt.decode(
+            decoded = jwt.decode(
                 jwt_bytes, secret, verify, algorithms, options, **validate
             )
         except jwt.PyJWTError as ex:
+            if started is not None:
+                decode_seconds.observe_since(started)
+                decode_total.inc(result=ex.__class__.__name__)
             raise cls.decode_error(ex)
+        if started is not None:
+            decode_seconds.observe_since(started)
+            decode_total.inc(result="success")
+        return decoded
 
     @classmethod
     def encode(
@@ -38,6 +54,12 @@ class Coder:
         json_encoder: Optional[json.JSONEncoder] = None,
     ) -> bytes:
         try:
-            return jwt.encode(token, secret, algorithm, headers, json_encoder)
+            return jwt.encode(
+                token,
+                secret,
+                algorithm,
+                headers,
+                json_encoder or json_backend.encoder_class(),
+            )
         except jwt.PyJWTError as ex:
             raise cls.encode_error(ex)
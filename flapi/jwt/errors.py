@@ -31,3 +31,11 @@ class JWTValidationError(FlaskJWTError):
     """
 
     ...
+
+
+class JWTRateLimitError(FlaskJWTError):
+    """
+    raised when a token holder exceeds their request rate
+    """
+
+    ...
@@ -0,0 +1,92 @@
+import collections
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import shared
+
+
+class LocalBuckets:
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self.buckets: "collections.OrderedDict[str, List[float]]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rate: float, capacity: float, now: float) -> bool:
+        with self._lock:
+            bucket = self.buckets.get(key, None)
+            if bucket is None:
+                bucket = self.buckets[key] = [capacity, now]
+                if len(self.buckets) > self.max_keys:
+                    self.buckets.popitem(last=False)
+            else:
+                self.buckets.move_to_end(key)
+                bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+            if bucket[0] < 1:
+                return False
+            bucket[0] -= 1
+            return True
+
+
+class SharedBuckets:
+    """
+    buckets held in shared memory, so limits apply across forked workers.
+    idle buckets are dropped once they would have refilled. a key colliding
+    with live buckets of other keys shares the most drained of them rather
+    than starting with a full bucket
+    """
+
+    bucket = struct.Struct("<dd")
+
+    def __init__(self, slots: int = 16384, stripes: int = 64, ways: int = 4):
+        self.table = shared.SharedTable(
+            slots, shared.SharedTable.header.size + self.bucket.size, stripes, ways
+        )
+
+    def take(self, key: str, rate: float, capacity: float, now: float) -> bool:
+        allowed = False
+
+        def _take(current: Optional[bytes]) -> Tuple[bytes, float]:
+            nonlocal allowed
+            tokens = capacity
+            if current is not None:
+                tokens, last = self.bucket.unpack(current)
+                tokens = min(capacity, tokens + (now - last) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            return self.bucket.pack(tokens, now), now + (capacity - tokens) / rate
+
+        self.table.update(self.table.digest(key), _take, now)
+        return allowed
+
+
+class RateLimit:
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        claim: str = "sub",
+        max_keys: int = 10000,
+        backend: Any = None,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self.claim = claim
+        self.backend = backend if backend is not None else LocalBuckets(max_keys)
+
+    def allow(self, key: str, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return self.backend.take(key, self.rate, self.capacity, now)
+
+    def __call__(self, token: Dict) -> bool:
+        key = token.get(self.claim, None)
+        if key is None:
+            return True
+        return self.allow(str(key))
@@ -2,13 +2,24 @@ import functools
 from typing import Any, Callable, Dict
 
 from . import builder, errors, rules
+from ..core import metrics, tracing
+
+rules_seconds = metrics.registry.histogram(
+    "flapi_jwt_rules_seconds", "time spent evaluating jwt rules by route"
+)
 
 
 class Protect:
     def __init__(self, *checks: rules.JwtRule):
         self.checks = rules.AllOf(*checks)
 
+    def compile(self) -> "Protect":
+        self.checks.compile()
+        return self
+
     def __call__(self, func: Callable) -> Callable:
+        route = getattr(func, "__qualname__", repr(func))
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             token: Dict = builder.Builder.current_token()
@@ -16,10 +27,18 @@ class Protect:
                 raise errors.JWTValidationError(
                     "client did not supply a token in request header"
                 )
-            if not self.checks(token):
+            started = metrics.registry.clock()
+            if tracing.tracer is None:
+                passed = self.checks(token)
+            else:
+                with tracing.tracer.span("flapi.jwt.protect", route=route):
+                    passed = self.checks(token)
+            rules_seconds.observe_since(started, route=route)
+            if not passed:
                 raise errors.JWTValidationError(
                     "one or more checks on the supplied jwt failed"
                 )
             return func(*args, **kwargs)
 
+        wrapper.flapi_protect = self
         return wrapper
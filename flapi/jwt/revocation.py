@@ -0,0 +1,140 @@
+import hashlib
+import logging
+import math
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate within (0, 1)")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _indexes(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode("utf8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for index in self._indexes(item):
+            self.bits[index >> 3] |= 1 << (index & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(
+            bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(item)
+        )
+
+
+class FileSource:
+    def __init__(self, path: str, encoding: str = "utf8"):
+        self.path = path
+        self.encoding = encoding
+
+    def __call__(self, cursor: Optional[int]) -> Tuple[List[str], int]:
+        offset = cursor or 0
+        if not os.path.exists(self.path):
+            return [], offset
+        if os.path.getsize(self.path) < offset:
+            offset = 0
+        with open(self.path, "rb") as stream:
+            stream.seek(offset)
+            data = stream.read()
+        complete = data.rfind(b"\n") + 1
+        lines = data[:complete].decode(self.encoding).splitlines()
+        return [line.strip() for line in lines if line.strip()], offset + complete
+
+
+class RevocationList:
+    def __init__(
+        self,
+        source: Optional[
+            Callable[[Optional[object]], Tuple[Iterable[str], object]]
+        ] = None,
+        lookup: Optional[Callable[[str], bool]] = None,
+        capacity: int = 100000,
+        error_rate: float = 0.001,
+        refresh_interval: Optional[float] = None,
+    ):
+        self.source = FileSource(source) if isinstance(source, str) else source
+        self.lookup = lookup
+        self.error_rate = error_rate
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.revoked: Set[str] = set()
+        self.cursor = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        if self.source is not None:
+            self.refresh()
+        if refresh_interval:
+            self.start(refresh_interval)
+
+    def add(self, *jtis: str) -> None:
+        with self._lock:
+            for jti in jtis:
+                if self.lookup is None:
+                    if jti in self.revoked:
+                        continue
+                    self.revoked.add(jti)
+                self.bloom.add(jti)
+            if self.lookup is None and self.bloom.count > self.bloom.capacity:
+                self._grow()
+
+    def _grow(self) -> None:
+        capacity = self.bloom.capacity * 2
+        while capacity < len(self.revoked):
+            capacity *= 2
+        bloom = BloomFilter(capacity, self.error_rate)
+        for jti in self.revoked:
+            bloom.add(jti)
+        self.bloom = bloom
+
+    def refresh(self) -> None:
+        jtis, self.cursor = self.source(self.cursor)
+        self.add(*jtis)
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("failed to refresh revocation list")
+
+    def start(self, interval: float) -> None:
+        if self.source is None:
+            raise ValueError("a source is required to refresh a revocation list")
+        self.stop()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        if jti is None or jti not in self.bloom:
+            return False
+        if self.lookup is not None:
+            return self.lookup(jti)
+        return jti in self.revoked
+
+    def __call__(self, token: Dict) -> bool:
+        return self.is_revoked(token.get("jti", None))
@@ -3,7 +3,7 @@ from typing import Any, Callable, Dict, List
 import flask
 import jsonpointer
 
-from flapi.core import rules
+from flapi.core import json_backend, rules
 
 AllOf = rules.AllOf
 AnyOf = rules.AnyOf
@@ -57,7 +57,9 @@ class MatchValue(JwtRule):
 
     @staticmethod
     def json(path: str, _: Any) -> Any:
-        return jsonpointer.resolve_pointer(flask.request.json, path)
+        return jsonpointer.resolve_pointer(
+            json_backend.request_json(flask.request), path
+        )
 
     @staticmethod
     def url(path: str, _: Any) -> Any:
@@ -0,0 +1,183 @@
+import hashlib
+import mmap
+import multiprocessing
+import struct
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from ..core import json_backend, metrics
+
+cache_total = metrics.registry.counter(
+    "flapi_jwt_cache_total", "token cache lookups by cache and result"
+)
+
+
+class SharedTable:
+    """
+    fixed size, set associative table of byte values held in an anonymous shared mmap.
+    each key maps to a set of `ways` slots. must be created before workers are
+    forked, every forked process then shares it
+    """
+
+    header = struct.Struct("<16sdI")
+
+    def __init__(
+        self,
+        slots: int = 4096,
+        slot_size: int = 1024,
+        stripes: int = 64,
+        ways: int = 4,
+    ):
+        if slot_size <= self.header.size:
+            raise ValueError(f"slot_size must be larger than {self.header.size}")
+        self.ways = max(1, min(ways, slots))
+        self.sets = max(1, slots // self.ways)
+        self.slots = self.sets * self.ways
+        self.slot_size = slot_size
+        self.capacity = slot_size - self.header.size
+        self.memory = mmap.mmap(-1, self.slots * slot_size)
+        self.locks = [multiprocessing.Lock() for _ in range(min(stripes, self.sets))]
+
+    @staticmethod
+    def digest(key: Union[str, bytes]) -> bytes:
+        if isinstance(key, str):
+            key = key.encode("utf8")
+        return hashlib.blake2b(key, digest_size=16).digest()
+
+    def _set(self, digest: bytes) -> int:
+        return int.from_bytes(digest[:8], "little") % self.sets
+
+    def _lock(self, index: int) -> Any:
+        return self.locks[index % len(self.locks)]
+
+    def _offsets(self, index: int) -> range:
+        start = index * self.ways * self.slot_size
+        return range(start, start + self.ways * self.slot_size, self.slot_size)
+
+    def _find(
+        self, digest: bytes, index: int, now: float, last: bool = True
+    ) -> Tuple[Optional[int], int, bool]:
+        """
+        the offset of the live slot holding digest (or None), the offset a new
+        value would go in and whether that slot holds another live key.
+        free or expired slots are used first, then the one expiring last
+        (or first, if last is false)
+        """
+        target, target_expires, live = None, 0.0, True
+        for offset in self._offsets(index):
+            stored, expires, length = self.header.unpack_from(self.memory, offset)
+            if not length or expires <= now:
+                if live:
+                    target, live = offset, False
+                continue
+            if stored == digest:
+                return offset, offset, False
+            if live and (target is None or (expires > target_expires) == last):
+                target, target_expires = offset, expires
+        return None, target, live
+
+    def _write(self, offset: int, digest: bytes, value: bytes, expires: float) -> None:
+        self.header.pack_into(self.memory, offset, digest, expires, len(value))
+        start = offset + self.header.size
+        self.memory[start : start + len(value)] = value
+
+    def _read(self, offset: int) -> bytes:
+        _, _, length = self.header.unpack_from(self.memory, offset)
+        start = offset + self.header.size
+        return self.memory[start : start + length]
+
+    def get(self, digest: bytes, now: Optional[float] = None) -> Optional[bytes]:
+        index = self._set(digest)
+        with self._lock(index):
+            found, _, _ = self._find(digest, index, time.time() if now is None else now)
+            return None if found is None else self._read(found)
+
+    def set(self, digest: bytes, value: bytes, expires: float) -> bool:
+        if len(value) > self.capacity:
+            return False
+        index = self._set(digest)
+        with self._lock(index):
+            _, offset, _ = self._find(digest, index, time.time(), last=False)
+            self._write(offset, digest, value, expires)
+        return True
+
+    def update(
+        self,
+        digest: bytes,
+        function: Callable[[Optional[bytes]], Tuple[bytes, float]],
+        now: Optional[float] = None,
+    ) -> bytes:
+        """
+        replaces the value of digest with function(current value). when every
+        slot of its set holds another live key, function is given the value
+        of the slot expiring last, which it then takes over, so a colliding
+        key never starts from nothing
+        """
+        index = self._set(digest)
+        with self._lock(index):
+            found, offset, live = self._find(
+                digest, index, time.time() if now is None else now
+            )
+            current = self._read(offset) if found is not None or live else None
+            value, expires = function(current)
+            if len(value) > self.capacity:
+                raise ValueError(f"value is larger than {self.capacity} bytes")
+            self._write(offset, digest, value, expires)
+        return value
+
+    def delete(self, digest: bytes) -> None:
+        index = self._set(digest)
+        with self._lock(index):
+            for offset in self._offsets(index):
+                stored, _, _ = self.header.unpack_from(self.memory, offset)
+                if stored == digest:
+                    self.header.pack_into(self.memory, offset, bytes(16), 0, 0)
+
+    def clear(self) -> None:
+        for lock in self.locks:
+            lock.acquire()
+        try:
+            self.memory[:] = bytes(len(self.memory))
+        finally:
+            for lock in self.locks:
+                lock.release()
+
+
+class SharedTokenCache:
+    """
+    verified token -> decoded claims, shared by every worker forked after creation.
+    entries expire with the token's exp claim, tokens without one are not cached
+    """
+
+    def __init__(
+        self,
+        slots: int = 4096,
+        slot_size: int = 1024,
+        stripes: int = 64,
+        ways: int = 4,
+    ):
+        self.table = SharedTable(slots, slot_size, stripes, ways)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Optional[Dict]:
+        data = self.table.get(self.table.digest(token))
+        if data is None:
+            self.misses += 1
+            if metrics.registry.enabled:
+                cache_total.inc(cache="decode", result="miss")
+            return None
+        self.hits += 1
+        if metrics.registry.enabled:
+            cache_total.inc(cache="decode", result="hit")
+        return json_backend.loads(data)
+
+    def set(self, token: str, claims: Dict) -> bool:
+        expires = claims.get("exp", None)
+        if not isinstance(expires, (int, float)) or isinstance(expires, bool):
+            return False
+        data = json_backend.dumps(claims).encode("utf8")
+        return self.table.set(self.table.digest(token), data, expires)
+
+    def clear(self) -> None:
+        self.table.clear()
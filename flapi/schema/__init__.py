@@ -1,14 +1,26 @@
-from . import protect as _protect, types as _types, errors as _errors
+from . import (
+    encoding as _encoding,
+    protect as _protect,
+    types as _types,
+    errors as _errors,
+    profiling as _profiling,
+)
 
 
 protect = _protect.Protect
+serialize = _encoding.Encoder
+
+profiler = _profiling.profiler
 
 Schema = _types.Schema
 
 Property = _types.Property
 custom_property = _types.CustomProperty
+intern_property = _types.intern_property
 
 Object = _types.Object
+Record = _types.Record
+record_class = _types.record_class
 Array = _types.Array
 Choice = _types.Choice
 Number = _types.Number
@@ -27,3 +39,4 @@ AnyOf = _types.AnyOf
 NoneOf = _types.NoneOf
 
 SchemaValidationError = _errors.SchemaValidationError
+LineValidationError = _errors.LineValidationError
@@ -0,0 +1,108 @@
+from typing import Any, Callable, Dict, Tuple, Type, Union
+
+from . import errors, types
+
+_true = frozenset(("true", "1", "yes", "on"))
+_false = frozenset(("false", "0", "no", "off"))
+
+
+def _number(kind: type) -> Callable[[Any], Any]:
+    def coerce(value: Any) -> Any:
+        if type(value) is not str:
+            return value
+        if not value:
+            return None
+        try:
+            return kind(value)
+        except ValueError:
+            raise errors.SchemaValidationError(
+                f"value {value!r} is not a valid {kind.__name__}"
+            )
+
+    return coerce
+
+
+def _bool(value: Any) -> Any:
+    if type(value) is not str:
+        return value
+    lowered = value.lower()
+    if lowered in _true:
+        return True
+    if lowered in _false:
+        return False
+    if not value:
+        return None
+    raise errors.SchemaValidationError(f"value {value!r} is not a valid bool")
+
+
+def _empty(value: Any) -> Any:
+    # dates, datetimes and uuids are parsed from strings by their properties
+    return None if value == "" else value
+
+
+def _keep(value: Any) -> Any:
+    return value
+
+
+def _coercion(prop: Any) -> Callable[[Any], Any]:
+    if isinstance(prop, types.Int):
+        return _number(int)
+    if isinstance(prop, types.Number):
+        return _number(float) if float in prop.types else _number(int)
+    if isinstance(prop, types.Bool):
+        return _bool
+    if isinstance(prop, (types.Date, types.DateTime, types.Uuid)):
+        return _empty
+    return _keep
+
+
+class Coercer:
+    """
+    validates string values, such as query parameters, form fields, headers
+    or url parts, against a schema. how each field is coerced from a string
+    (and whether it takes multiple values, for Array fields) is worked out
+    once, each call then makes a single pass over the fields
+    """
+
+    def __init__(
+        self,
+        schema: Union[Type[types.Schema], types.Schema, types.Object],
+        headers: bool = False,
+    ):
+        schema = schema() if isinstance(schema, type) else schema
+        self.prop = schema.object if isinstance(schema, types.Schema) else schema
+        self.fields: Tuple[Tuple[str, str, bool, Callable[[Any], Any]], ...] = tuple(
+            (
+                key,
+                # header fields are named like x_request_id for X-Request-Id
+                key.replace("_", "-") if headers else key,
+                isinstance(prop, types.Array),
+                _coercion(prop.schema if isinstance(prop, types.Array) else prop),
+            )
+            for key, prop in self.prop.schema.items()
+        )
+        # requests always carry headers the schema does not mention
+        self.strict = not headers and self.prop.strict is True
+        self.names = frozenset(name for _, name, _, _ in self.fields)
+
+    def compile(self) -> "Coercer":
+        self.prop.compile()
+        return self
+
+    def __call__(self, source: Any) -> Any:
+        getlist = getattr(source, "getlist", None)
+        values: Dict[str, Any] = {}
+        for key, name, many, coerce in self.fields:
+            try:
+                if not many:
+                    values[key] = coerce(source.get(name, None))
+                elif getlist is not None:
+                    values[key] = [coerce(value) for value in getlist(name)]
+                else:
+                    value = source.get(name, None)
+                    values[key] = None if value is None else [coerce(value)]
+            except errors.SchemaValidationError as ex:
+                raise errors.SchemaValidationError(f"{name}: {ex}")
+        if self.strict and not self.names.issuperset(source):
+            raise errors.SchemaValidationError("object contains extra fields")
+        return self.prop(values)
@@ -0,0 +1,88 @@
+import array
+import importlib
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# typecodes for array.array and the matching numpy dtype
+_dtypes = {"q": "int64", "d": "float64", "b": "bool"}
+
+_numpy: Any = None
+
+
+def numpy() -> Optional[Any]:
+    """
+    returns numpy if it is installed, it is imported on first use
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            _numpy = importlib.import_module("numpy")
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+class Column:
+
+    __slots__ = ("func", "kind", "values")
+
+    def __init__(self, func: Callable, column_type: Optional[Tuple[str, type]]):
+        self.func = func
+        if column_type is None:
+            self.kind = None
+            self.values: Union[array.array, List] = []
+        else:
+            typecode, self.kind = column_type
+            self.values = array.array(typecode)
+
+    def append(self, value: Any) -> None:
+        if self.kind is not None:
+            try:
+                self.values.append(value)
+                return
+            except (TypeError, OverflowError):
+                # None or a value too large for the array, keep a list instead
+                self.values = [self.kind(item) for item in self.values]
+                self.kind = None
+        self.values.append(value)
+
+    def finish(self) -> Union[array.array, List, Any]:
+        if self.kind is None:
+            return self.values
+        return _to_numpy(self.values)
+
+
+def _to_numpy(values: array.array) -> Union[array.array, Any]:
+    module = numpy()
+    if module is None:
+        return values
+    return module.asarray(values, dtype=_dtypes[values.typecode])
+
+
+def pack(values: List, column_type: Tuple[str, type]) -> Union[array.array, List, Any]:
+    """
+    packs a list of numbers into a numpy array or array.array, or leaves it as
+    a list if a value is null or does not fit
+    """
+    try:
+        packed = array.array(column_type[0], values)
+    except (TypeError, OverflowError):
+        return values
+    return _to_numpy(packed)
+
+
+def columns(
+    fields: Dict[str, Callable],
+    column_types: Dict[str, Optional[Tuple[str, type]]],
+    check: Callable[[Any], Any],
+    values: List[Any],
+) -> Dict[str, Any]:
+    """
+    validates a list of objects straight into per field columns. check
+    validates the object itself, each field is then validated by its property
+    """
+    built = {key: Column(func, column_types[key]) for key, func in fields.items()}
+    for value in values:
+        value = check(value)
+        for key, column in built.items():
+            column.append(column.func(value.get(key, None)))
+    return {key: column.finish() for key, column in built.items()}
@@ -0,0 +1,119 @@
+import importlib
+import zlib
+from typing import IO, Any, Callable, Optional, Tuple, Type
+
+from . import errors
+
+# zlib window bits for gzip and deflate (zlib wrapped) bodies
+_wbits = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "x-gzip": 16 + zlib.MAX_WBITS,
+    "deflate": zlib.MAX_WBITS,
+}
+
+
+class DecompressingStream:
+    """
+    a file like object decompressing a request stream as it is read.
+    at most as much as is read is decompressed, and reading raises a
+    validation error once more than max_size bytes have been decompressed
+    """
+
+    chunk_size = 64 << 10
+
+    def __init__(self, stream: IO[bytes], encoding: str, max_size: int):
+        self.stream = stream
+        self.encoding = encoding
+        self.max_size = max_size
+        self.size = 0
+        self.buffer = bytearray()
+        self.eof = False
+        self._errors: Tuple[Type[Exception], ...] = (zlib.error, ValueError)
+        if encoding in _wbits:
+            self._decompressor = zlib.decompressobj(_wbits[encoding])
+            self._decompress: Callable[[int], bytes] = self._zlib
+        elif encoding == "zstd":
+            zstandard = _zstandard()
+            if zstandard is None:
+                raise errors.SchemaValidationError("zstd bodies are not supported")
+            reader = zstandard.ZstdDecompressor().stream_reader(stream)
+            self._decompress = reader.read
+            self._errors += (zstandard.ZstdError,)
+        else:
+            raise errors.SchemaValidationError(
+                f"unsupported content encoding {encoding}"
+            )
+
+    def _zlib(self, size: int) -> bytes:
+        decompressor = self._decompressor
+        while not decompressor.eof:
+            if decompressor.unconsumed_tail:
+                data = decompressor.decompress(decompressor.unconsumed_tail, size)
+            else:
+                raw = self.stream.read(self.chunk_size)
+                if not raw:
+                    raise zlib.error("body ended unexpectedly")
+                data = decompressor.decompress(raw, size)
+            if data:
+                return data
+        return b""
+
+    def _fill(self, size: int) -> None:
+        while len(self.buffer) < size and not self.eof:
+            try:
+                data = self._decompress(max(size - len(self.buffer), self.chunk_size))
+            except self._errors as ex:
+                raise errors.SchemaValidationError(
+                    f"invalid {self.encoding} body: {ex}"
+                )
+            if not data:
+                self.eof = True
+                return
+            self.size += len(data)
+            if self.size > self.max_size:
+                raise errors.SchemaValidationError(
+                    f"decompressed body is larger than {self.max_size} bytes"
+                )
+            self.buffer += data
+
+    def _take(self, size: int) -> bytes:
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            while not self.eof:
+                self._fill(len(self.buffer) + self.chunk_size)
+            return self._take(len(self.buffer))
+        self._fill(size)
+        return self._take(size)
+
+    def readline(self, limit: int = -1) -> bytes:
+        start = 0
+        while True:
+            index = self.buffer.find(b"\n", start)
+            if index >= 0 and (limit < 0 or index < limit):
+                return self._take(index + 1)
+            if 0 <= limit <= len(self.buffer) or self.eof:
+                return self._take(limit if limit >= 0 else len(self.buffer))
+            start = len(self.buffer)
+            self._fill(len(self.buffer) + self.chunk_size)
+
+
+def _zstandard() -> Optional[Any]:
+    try:
+        return importlib.import_module("zstandard")
+    except ImportError:
+        return None
+
+
+def content_encoding(request: Any) -> Optional[str]:
+    """
+    the content encoding of a request, or None if it is not compressed
+    """
+    encoding = request.headers.get("Content-Encoding", None)
+    if not isinstance(encoding, str):
+        return None
+    encoding = encoding.strip().lower()
+    return None if encoding in ("", "identity") else encoding
@@ -0,0 +1,140 @@
+import json
+import json.decoder
+import json.scanner
+import re
+from typing import Any, Dict, List, Tuple, Union
+
+from . import errors, profiling, types
+
+_whitespace = re.compile(r"[ \t\n\r]*")
+_spaces = " \t\n\r"
+
+
+def _skip(text: str, index: int) -> int:
+    if text[index : index + 1] in _spaces:
+        return _whitespace.match(text, index).end()
+    return index
+
+
+_scanstring = json.decoder.scanstring
+
+
+def _invalid(text: str, index: int) -> json.JSONDecodeError:
+    return json.JSONDecodeError("Unexpected character", text, index)
+
+
+class Decoder:
+    """
+    decodes json text driven by a schema, so the body is traversed once.
+    objects and arrays of the schema are walked here, keys are checked as they
+    are read (extra fields in strict objects are rejected before their value
+    is parsed) and leaf values are parsed by the json scanner and validated
+    straight away. anything the walk can not do on its own (callbacks on
+    objects or arrays, choices, columnar arrays) is parsed and then validated
+    as usual
+    """
+
+    def __init__(self, schema: Union[types.Schema, types.Property]):
+        self.prop = schema.object if isinstance(schema, types.Schema) else schema
+        self.scan_once = json.scanner.make_scanner(json.JSONDecoder())
+
+    def decode(self, text: Union[str, bytes]) -> Any:
+        if isinstance(text, bytes):
+            text = text.decode(json.detect_encoding(text))
+        if profiling.profiler.active:
+            return self.prop(self._loads(text))
+        index = _skip(text, 0)
+        try:
+            value, index = self._value(self.prop, text, index)
+        except StopIteration as ex:
+            # raised by the scanner when there is no value at an index
+            raise errors.SchemaValidationError(
+                f"invalid json: {_invalid(text, ex.value)}"
+            )
+        except json.JSONDecodeError as ex:
+            raise errors.SchemaValidationError(f"invalid json: {ex}")
+        if _skip(text, index) != len(text):
+            raise errors.SchemaValidationError(f"invalid json, extra data at {index}")
+        return value
+
+    @staticmethod
+    def _loads(text: str) -> Any:
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as ex:
+            raise errors.SchemaValidationError(f"invalid json: {ex}")
+
+    def _value(self, prop: Any, text: str, index: int) -> Tuple[Any, int]:
+        if isinstance(prop, types.Schema):
+            prop = prop.object
+        char = text[index : index + 1]
+        if char == "{" and type(prop) is types.Object and prop.callback is None:
+            return self._object(prop, text, index + 1)
+        if (
+            char == "["
+            and type(prop) is types.Array
+            and prop.callback is None
+            and prop.bulk is None
+            and not prop.columnar
+        ):
+            return self._array(prop, text, index + 1)
+        value, index = self.scan_once(text, index)
+        return prop(value), index
+
+    def _object(self, prop: types.Object, text: str, index: int) -> Tuple[Any, int]:
+        fields = prop.schema
+        found: Dict[str, Any] = {}
+        index = _skip(text, index)
+        if text[index : index + 1] == "}":
+            index += 1
+        else:
+            while True:
+                if text[index : index + 1] != '"':
+                    raise _invalid(text, index)
+                key, index = _scanstring(text, index + 1)
+                index = _skip(text, index)
+                if text[index : index + 1] != ":":
+                    raise _invalid(text, index)
+                index = _skip(text, index + 1)
+                func = fields.get(key, None)
+                if func is not None:
+                    found[key], index = self._value(func, text, index)
+                elif prop.strict:
+                    raise errors.SchemaValidationError("object contains extra fields")
+                else:
+                    _, index = self.scan_once(text, index)
+                index = _skip(text, index)
+                char = text[index : index + 1]
+                index = _skip(text, index + 1)
+                if char == "}":
+                    break
+                if char != ",":
+                    raise _invalid(text, index)
+        if prop.partial:
+            return found, index
+        values = [
+            found[key] if key in found else func(None) for key, func in fields.items()
+        ]
+        if prop.record is not None:
+            return prop.record(*values), index
+        return dict(zip(fields, values)), index
+
+    def _array(self, prop: types.Array, text: str, index: int) -> Tuple[List, int]:
+        items = []
+        index = _skip(text, index)
+        if text[index : index + 1] == "]":
+            index += 1
+        else:
+            while True:
+                item, index = self._value(prop.schema, text, index)
+                items.append(item)
+                index = _skip(text, index)
+                char = text[index : index + 1]
+                index = _skip(text, index + 1)
+                if char == "]":
+                    break
+                if char != ",":
+                    raise _invalid(text, index)
+        if not prop.range(items):
+            raise errors.SchemaValidationError(f"value {items} is out of defined range")
+        return items, index
@@ -0,0 +1,126 @@
+import array
+import datetime
+import functools
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from . import types
+from ..core import json_backend
+
+Prepare = Optional[Callable[[Any], Any]]
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(timespec="microseconds")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, types.Record):
+        return value._asdict()
+    if isinstance(value, array.array) or hasattr(value, "tolist"):
+        # packed and columnar arrays, numpy arrays included
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _date(value: Any) -> Any:
+    return value.isoformat() if type(value) is datetime.date else value
+
+
+def _datetime(value: Any) -> Any:
+    if type(value) is datetime.datetime:
+        return value.isoformat(timespec="microseconds")
+    return value
+
+
+def _object(prop: types.Object) -> Prepare:
+    fields: List[Tuple[str, Callable]] = []
+    for key, func in prop.schema.items():
+        prepare = _prepare(func)
+        if prepare is not None:
+            fields.append((key, prepare))
+    if not fields and prop.record is None:
+        return None
+
+    def prepare_object(value: Any) -> Any:
+        if isinstance(value, types.Record):
+            value = value._asdict()
+        elif type(value) is dict and fields:
+            value = dict(value)
+        else:
+            return value
+        for key, prepare_field in fields:
+            if key in value:
+                value[key] = prepare_field(value[key])
+        return value
+
+    return prepare_object
+
+
+def _array(prop: types.Array) -> Prepare:
+    prepare_item = _prepare(prop.schema)
+    if prepare_item is None:
+        return None
+
+    def prepare_array(value: Any) -> Any:
+        if type(value) is not list:
+            return value
+        return [prepare_item(item) for item in value]
+
+    return prepare_array
+
+
+def _prepare(prop: Any) -> Prepare:
+    """
+    returns a function converting values of prop into values the json encoder
+    handles natively, or None if there is nothing to convert
+    """
+    if isinstance(prop, types.Schema):
+        prop = prop.object
+    if type(prop) is types.Object:
+        return _object(prop)
+    if type(prop) is types.Array and not prop.columnar:
+        return _array(prop)
+    if type(prop) is types.Date:
+        return _date
+    if type(prop) is types.DateTime:
+        return _datetime
+    return None
+
+
+class Encoder:
+    """
+    serializes values shaped like a schema to json. the schema decides up
+    front which parts of a value need converting (dates, datetimes, records),
+    everything else is handed to the json encoder untouched. values are not
+    validated. also a decorator, turning the return value of a view into a
+    json response
+    """
+
+    mimetype = "application/json"
+
+    def __init__(self, schema: Union[types.Schema, types.Property, type]):
+        schema = schema() if isinstance(schema, type) else schema
+        self.prepare = _prepare(schema)
+
+    def encode(self, value: Any) -> str:
+        if self.prepare is not None:
+            value = self.prepare(value)
+        return json_backend.dumps(value, _default)
+
+    def response(self, value: Any, status: int = None, headers: Any = None) -> Any:
+        # flask is imported on first use so encoding alone does not load it
+        import flask
+
+        return flask.current_app.response_class(
+            self.encode(value), status=status, headers=headers, mimetype=self.mimetype
+        )
+
+    def __call__(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            value = func(*args, **kwargs)
+            if isinstance(value, tuple):
+                return self.response(*value)
+            return self.response(value)
+
+        return _call
@@ -1,2 +1,12 @@
 class SchemaValidationError(ValueError):
     pass
+
+
+class LineValidationError(SchemaValidationError):
+    """
+    raised when a line of a newline delimited json body fails validation
+    """
+
+    def __init__(self, line: int, message: str):
+        super(LineValidationError, self).__init__(f"line {line}: {message}")
+        self.line = line
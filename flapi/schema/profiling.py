@@ -0,0 +1,99 @@
+import contextlib
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class _NotProfiling:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *_: Any) -> None:
+        return None
+
+
+class Profiler:
+    """
+    records cumulative validation time and call counts per field path,
+    eg. /items/*/created_at. times are inclusive of nested fields, callbacks
+    (path#callback) and custom property functions (path#custom)
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_rate = 1.0
+        self.stats: Dict[str, List] = {}
+        self._running = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def enable(self, sample_rate: float = 1.0) -> None:
+        self.sample_rate = sample_rate
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def clear(self) -> None:
+        with self._lock:
+            self.stats = {}
+
+    @property
+    def active(self) -> bool:
+        return self._running > 0 and getattr(self._local, "path", None) is not None
+
+    @contextlib.contextmanager
+    def profile(self) -> Iterator[None]:
+        if getattr(self._local, "path", None) is not None:
+            yield
+            return
+        with self._lock:
+            self._running += 1
+        self._local.path = ""
+        try:
+            yield
+        finally:
+            self._local.path = None
+            with self._lock:
+                self._running -= 1
+
+    def sample(self) -> Any:
+        if self.enabled and random.random() < self.sample_rate:  # nosec
+            return self.profile()
+        return _NotProfiling()
+
+    def _record(self, path: str, seconds: float) -> None:
+        with self._lock:
+            stat = self.stats.get(path, None)
+            if stat is None:
+                self.stats[path] = [seconds, 1]
+            else:
+                stat[0] += seconds
+                stat[1] += 1
+
+    def field(self, segment: str, func: Callable, value: Any) -> Any:
+        parent = self._local.path
+        path = self._local.path = f"{parent}/{segment}"
+        started = time.perf_counter()
+        try:
+            return func(value)
+        finally:
+            self._record(path, time.perf_counter() - started)
+            self._local.path = parent
+
+    def call(self, suffix: str, func: Callable, *args: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self._record(f"{self._local.path}#{suffix}", time.perf_counter() - started)
+
+    def report(self, limit: Optional[int] = None) -> List[Tuple[str, float, int]]:
+        with self._lock:
+            rows = [(path, stat[0], stat[1]) for path, stat in self.stats.items()]
+        rows.sort(key=lambda row: row[1], reverse=True)
+        return rows[:limit] if limit is not None else rows
+
+
+profiler = Profiler()
@@ -1,10 +1,15 @@
 import functools
-from typing import Any, Callable, Type, Union
+from typing import IO, Any, Callable, Dict, Iterator, Optional, Type, Union
 
-import flask
+from . import coercion, compression, decoding, errors, profiling, types
+from ..core import json_backend, metrics, rules, tracing
 
-from . import errors, types
-from ..core import rules
+validation_seconds = metrics.registry.histogram(
+    "flapi_schema_validation_seconds", "time spent validating request bodies by schema"
+)
+validation_total = metrics.registry.counter(
+    "flapi_schema_validation_total", "validated request bodies by schema and result"
+)
 
 
 class Protect:
@@ -20,6 +25,15 @@ class Protect:
             rules.Rule,
             None,
         ],
+        decode: bool = False,
+        ndjson: bool = False,
+        max_line: int = 1 << 20,
+        max_decompressed: int = 16 << 20,
+        args: Union[Type[types.Schema], types.Schema, types.Object, None] = None,
+        form: Union[Type[types.Schema], types.Schema, types.Object, None] = None,
+        headers: Union[Type[types.Schema], types.Schema, types.Object, None] = None,
+        view_args: Union[Type[types.Schema], types.Schema, types.Object, None] = None,
+        partial: bool = False,
     ):
         self.rule = (
             rule()
@@ -27,32 +41,163 @@ class Protect:
             and issubclass(rule, (types.Property, types.Schema))
             else rule
         )
+        if partial:
+            if not isinstance(self.rule, types.Schema):
+                raise ValueError("partial bodies require a Schema")
+            self.rule = type(self.rule)(partial=True)
+        self.decoder = (
+            decoding.Decoder(self.rule)
+            if decode and isinstance(self.rule, (types.Property, types.Schema))
+            else None
+        )
+        if ndjson and not isinstance(self.rule, (types.Property, types.Schema)):
+            raise ValueError("ndjson bodies require a Schema or Property")
+        self.ndjson = ndjson
+        self.max_line = max_line
+        self.max_decompressed = max_decompressed
+        self.sources: Dict[str, coercion.Coercer] = {
+            name: coercion.Coercer(schema, headers=name == "headers")
+            for name, schema in (
+                ("args", args),
+                ("form", form),
+                ("headers", headers),
+                ("view_args", view_args),
+            )
+            if schema is not None
+        }
+
+    def compile(self) -> "Protect":
+        if isinstance(self.rule, (types.Property, types.Schema)):
+            types.compile_property(self.rule)
+        elif isinstance(self.rule, rules.Rule):
+            self.rule.compile()
+        for coercer in self.sources.values():
+            coercer.compile()
+        return self
 
     @property
+    def name(self) -> str:
+        return self.rule.__class__.__name__
+
+    def _validate(self, body: Any, check: Callable = None) -> Any:
+        with profiling.profiler.sample():
+            return self._measure(body, check or self.rule)
+
+    def _measure(self, body: Any, check: Callable) -> Any:
+        started = metrics.registry.clock()
+        if started is None:
+            return check(body)
+        try:
+            body = check(body)
+        except errors.SchemaValidationError:
+            validation_seconds.observe_since(started, schema=self.name)
+            validation_total.inc(schema=self.name, result="invalid")
+            raise
+        validation_seconds.observe_since(started, schema=self.name)
+        validation_total.inc(schema=self.name, result="valid")
+        return body
+
+    def _lines(self, stream: IO[bytes]) -> Iterator[Any]:
+        check = self.rule if self.decoder is None else self.decoder.decode
+        number = 0
+        while True:
+            # reads at most max_line bytes at a time, however long the line
+            line = stream.readline(self.max_line + 1)
+            if not line:
+                return
+            number += 1
+            if len(line) > self.max_line and not line.endswith(b"\n"):
+                raise errors.LineValidationError(
+                    number, f"line is longer than {self.max_line} bytes"
+                )
+            if not line.strip():
+                continue
+            try:
+                if self.decoder is None:
+                    line = json_backend.loads(line)
+                value = self._validate(line, check)
+            except ValueError as ex:
+                # json decode errors and schema validation errors alike
+                raise errors.LineValidationError(number, str(ex)) from ex
+            yield value
+
+    def _stream(self, request: Any) -> Optional[compression.DecompressingStream]:
+        encoding = compression.content_encoding(request)
+        if encoding is None:
+            return None
+        return compression.DecompressingStream(
+            request.stream, encoding, self.max_decompressed
+        )
+
+    @staticmethod
+    def _json(request: Any, stream: Optional[IO[bytes]]) -> Any:
+        if stream is None:
+            return json_backend.request_json(request)
+        if not request.is_json:
+            return None
+        try:
+            return json_backend.loads(stream.read())
+        except errors.SchemaValidationError:
+            raise
+        except ValueError as ex:
+            return request.on_json_loading_failed(ex)
+
+    @property
+    @tracing.traced("flapi.schema.request_body")
     def request_body(self):
+        # flask is imported on first use so validation alone does not load it
+        import flask
+
+        request = flask.request
+        stream = self._stream(request)
         if self.rule is True:
-            if not flask.request.is_json:
+            if not request.is_json:
                 raise errors.SchemaValidationError(
                     "request was expected to contain json"
                 )
-            return flask.request.json
+            return self._json(request, stream)
         if self.rule is False:
-            if flask.request.is_json:
+            if request.is_json:
                 raise errors.SchemaValidationError(
                     "request was not expected to contain json"
                 )
             return None
         if self.rule is None:
-            if flask.request.is_json:
-                return flask.request.json
+            if request.is_json:
+                return self._json(request, stream)
             return None
+        if self.ndjson:
+            return self._lines(request.stream if stream is None else stream)
+        if self.decoder is not None and request.is_json:
+            data = request.get_data() if stream is None else stream.read()
+            return self._validate(data, self.decoder.decode)
         if isinstance(self.rule, (types.Property, types.Schema)):
-            return self.rule(flask.request.json)
+            return self._validate(self._json(request, stream))
         raise errors.SchemaValidationError(f"unknown rule {self.rule}")
 
+    def _request_values(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        import flask
+
+        # url parts are passed to views as keyword arguments already, they
+        # are validated before any other source is added to them
+        url = dict(kwargs)
+        for name, coercer in self.sources.items():
+            if name == "view_args":
+                values = coercer(url)
+                if isinstance(values, types.Record):
+                    values = values._asdict()
+                kwargs.update(values)
+            else:
+                kwargs[name] = coercer(getattr(flask.request, name))
+        return kwargs
+
     def __call__(self, func: Callable) -> Callable:
         @functools.wraps(func)
         def _call(*args: Any, **kwargs: Any) -> Any:
-            return func(self.request_body, *args, **kwargs)
+            body = self.request_body
+            if self.sources:
+                kwargs = self._request_values(kwargs)
+            return func(body, *args, **kwargs)
 
+        _call.flapi_protect = self
         return _call
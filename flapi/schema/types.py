@@ -2,11 +2,15 @@ import copy
 import datetime
 import functools
 import re
+import threading
+import weakref
 from typing import Any, Callable, ClassVar, Dict, List, Pattern, Tuple, Type, Union
 
-from . import errors
+from . import columns, errors, profiling
 from ..core import rules
 
+profiler = profiling.profiler
+
 AllOf = rules.AllOf
 AnyOf = rules.AnyOf
 NoneOf = rules.NoneOf
@@ -14,6 +18,9 @@ Callback = rules.Callback
 
 
 class _Range:
+
+    __slots__ = ("min", "max", "__weakref__")
+
     def __init__(
         self,
         minimum: Union[
@@ -26,6 +33,10 @@ class _Range:
         self.min = minimum
         self.max = maximum
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        _check_mutable(self)
+        object.__setattr__(self, name, value)
+
     def __call__(
         self,
         value: Union[
@@ -51,13 +62,14 @@ class _Range:
 
 
 class Schema:
-    def __init__(self):
+    def __init__(self, partial: bool = False):
         self.object = Object(
             self.__class__,
             strict=self._is_strict,
             nullable=False,
             default=None,
             callback=None,
+            partial=partial,
         )
 
     @property
@@ -69,6 +81,11 @@ class Schema:
 
 
 class Property(rules.Rule):
+
+    # subclasses declare their own __slots__ to stay free of a __dict__,
+    # subclasses that do not (eg. in applications) simply get one back
+    __slots__ = ("types", "nullable", "default", "callback", "__weakref__")
+
     def __init__(
         self,
         *types: Type[Any],
@@ -81,6 +98,13 @@ class Property(rules.Rule):
         self.default = default
         self.callback = callback
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        _check_mutable(self)
+        object.__setattr__(self, name, value)
+
+    def compile(self) -> "Property":
+        return self
+
     def _get_value(self, value: Any) -> Any:
         if value is not None:
             return value
@@ -101,11 +125,116 @@ class Property(rules.Rule):
                 f"value: {value} is not of expected type"
             )
         if self.callback is not None:
+            if profiler.active:
+                return profiler.call("callback", self.callback, value)
             return self.callback(value)
         return value
 
 
+def compile_property(prop: Any) -> Any:
+    # schema classes treat every public attribute as a field, so they have no
+    # compile method of their own
+    if isinstance(prop, Schema):
+        prop.object.compile()
+    elif isinstance(prop, Property):
+        prop.compile()
+    return prop
+
+
+# structurally identical properties are shared process-wide, see intern_property
+_nodes: "weakref.WeakValueDictionary[Tuple, Property]" = weakref.WeakValueDictionary()
+_nodes_lock = threading.Lock()
+_slot_names: Dict[type, Tuple[str, ...]] = {}
+# shared instances (and their ranges) by id, these can no longer be modified
+_frozen: "weakref.WeakValueDictionary[int, Any]" = weakref.WeakValueDictionary()
+
+
+def _check_mutable(node: Any) -> None:
+    if _frozen.get(id(node), None) is node:
+        raise AttributeError(
+            f"{type(node).__name__} is shared by identical properties and can not be"
+            " modified, define a new property instead"
+        )
+
+
+def _slots(cls: type) -> Tuple[str, ...]:
+    names = _slot_names.get(cls, None)
+    if names is None:
+        names = _slot_names[cls] = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in getattr(klass, "__slots__", ())
+            if name != "__weakref__"
+        )
+    return names
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, _Range):
+        return _Range, _freeze(value.min), _freeze(value.max)
+    if isinstance(value, Property):
+        # children are interned first, so identity is structural equality
+        return Property, id(value)
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(item) for item in value)
+    hash(value)
+    # 1, 1.0 and True compare equal but are not interchangeable bounds
+    return type(value), value
+
+
+def _key(prop: Property) -> Tuple:
+    return (type(prop),) + tuple(
+        _freeze(getattr(prop, name, None)) for name in _slots(type(prop))
+    )
+
+
+def intern_property(prop: Any) -> Any:
+    """
+    returns a shared instance structurally identical to prop, or prop itself
+    if it is not a slotted built-in property (ie. it may carry extra state).
+    an instance can no longer be modified once it is shared
+    """
+    if not isinstance(prop, Property) or hasattr(prop, "__dict__"):
+        return prop
+    if isinstance(prop, (Object, Choice)):
+        return prop
+    if isinstance(prop, Array):
+        child = intern_property(prop.schema)
+        if child is not prop.schema:
+            prop.schema = child
+    try:
+        key = _key(prop)
+    except TypeError:
+        return prop
+    with _nodes_lock:
+        shared = _nodes.get(key, None)
+        if (
+            shared is not None
+            and shared is not prop
+            and _frozen.get(id(shared), None) is not shared
+        ):
+            # not shared yet, so it may have been modified since it was registered
+            try:
+                if _key(shared) != key:
+                    shared = None
+            except TypeError:
+                shared = None
+        if shared is None:
+            _nodes[key] = shared = prop
+        elif shared is not prop:
+            # only frozen once it is actually used in place of another
+            _frozen[id(shared)] = shared
+            for name in _slots(type(shared)):
+                value = getattr(shared, name, None)
+                if isinstance(value, _Range):
+                    _frozen[id(value)] = value
+    return shared
+
+
 class CustomProperty(Property):
+
+    __slots__ = ()
+
     def __init__(self, *args: Type, **kwargs: Any):
         super(CustomProperty, self).__init__(*args, **kwargs)
 
@@ -113,62 +242,266 @@ class CustomProperty(Property):
         @functools.wraps(func)
         def _wrapped(value: Any):
             value: Any = super(CustomProperty, self).__call__(value)
+            if profiler.active:
+                return profiler.call("custom", func, func.__class__, value)
             return func(func.__class__, value)
 
         return _wrapped
 
 
+# resolved fields per schema class, so a schema nested in many others is only
+# scanned once
+_fields: "weakref.WeakKeyDictionary[type, Dict]" = weakref.WeakKeyDictionary()
+
+
+class Record:
+    """
+    base class of the slotted records returned for schemas with __record__
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *values: Any):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def _asdict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._asdict() == other._asdict()
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{k}={v!r}" for k, v in self._asdict().items())
+        return f"{type(self).__name__}({values})"
+
+
+_records: "weakref.WeakKeyDictionary[type, Type[Record]]" = weakref.WeakKeyDictionary()
+
+
+def record_class(schema: Type[Schema]) -> Type[Record]:
+    """
+    returns the record class for a schema, generated once per schema class
+    """
+    record = _records.get(schema, None)
+    if record is None:
+        fields = tuple(Object._load(schema))
+        record = _records[schema] = type(
+            f"{schema.__name__}Record",
+            (Record,),
+            {"__slots__": fields, "__module__": schema.__module__},
+        )
+    return record
+
+
 class Object(Property):
-    def __init__(self, schema: Type[Schema], strict: bool = False, **kwargs):
+
+    __slots__ = ("strict", "schema", "record", "partial")
+
+    def __init__(
+        self,
+        schema: Type[Schema],
+        strict: bool = False,
+        record: bool = False,
+        partial: bool = False,
+        **kwargs,
+    ):
         super(Object, self).__init__(dict, **kwargs)
         self.strict = strict or schema._is_strict
         self.schema = self._load(schema)
+        self.partial = partial or getattr(schema, "__partial__", False)
+        # partial objects leave fields out, so they are never records
+        self.record = (
+            record_class(schema)
+            if (record or getattr(schema, "__record__", False)) and not self.partial
+            else None
+        )
 
     @classmethod
     def _load(cls, schema: Type[Schema]) -> Dict:
-        return {f: getattr(schema, f) for f in dir(schema) if not f.startswith("_")}
+        fields = _fields.get(schema, None)
+        if fields is None:
+            fields = _fields[schema] = {}
+            for f in dir(schema):
+                if f.startswith("_"):
+                    continue
+                prop = getattr(schema, f)
+                fields[f] = shared = intern_property(prop)
+                if shared is not prop and vars(schema).get(f, None) is prop:
+                    # let the duplicate go rather than keeping it on the class
+                    setattr(schema, f, shared)
+        return dict(fields)
+
+    def compile(self) -> "Object":
+        for prop in self.schema.values():
+            compile_property(prop)
+        return self
 
     def _valid_fields(self, obj: Dict) -> bool:
         return all(key in self.schema for key in obj)
 
-    def _valid_values(self, obj: Dict) -> Dict:
+    def _valid_partial(self, obj: Dict) -> Dict:
+        """
+        validates only the fields present in obj, so defaults and missing
+        non nullable fields are left alone (eg. for PATCH bodies)
+        """
+        schema = self.schema
+        if profiler.active:
+            return {
+                key: profiler.field(key, schema[key], value)
+                for key, value in obj.items()
+                if key in schema
+            }
+        return {key: schema[key](value) for key, value in obj.items() if key in schema}
+
+    def _valid_values(self, obj: Dict) -> Union[Dict, Record]:
+        if self.partial:
+            return self._valid_partial(obj)
+        if profiler.active:
+            values = {
+                key: profiler.field(key, func, obj.get(key, None))
+                for key, func in self.schema.items()
+            }
+            return values if self.record is None else self.record(*values.values())
+        if self.record is not None:
+            return self.record(
+                *[func(obj.get(key, None)) for key, func in self.schema.items()]
+            )
         return {key: func(obj.get(key, None)) for key, func in self.schema.items()}
 
-    def __call__(self, value: Union[Dict, None]) -> Union[Dict, None]:
+    def _checked(self, value: Union[Dict, None]) -> Union[Dict, None]:
         value = super(Object, self).__call__(value)
         if value is None:
             return None
         if self.strict and not self._valid_fields(value):
             raise errors.SchemaValidationError("object contains extra fields")
+        return value
+
+    def _checked_item(self, value: Union[Dict, None]) -> Dict:
+        value = self._checked(value)
+        if value is None:
+            raise errors.SchemaValidationError("columnar arrays cannot contain null")
+        return value
+
+    def __call__(self, value: Union[Dict, None]) -> Union[Dict, None]:
+        value = self._checked(value)
+        if value is None:
+            return None
         return self._valid_values(value)
 
 
 class Array(Property):
+
+    __slots__ = ("schema", "range", "columnar", "packed", "bulk")
+
     def __init__(
         self,
         schema: Union[Property, Type[Property]],
         min_length: Union[int, Callable] = None,
         max_length: Union[int, Callable] = None,
         callback=None,
+        columnar: bool = False,
+        packed: bool = False,
     ):
         super(Array, self).__init__(list, nullable=False, default=[], callback=callback)
         self.schema = schema() if isinstance(schema, type) else schema
         self.range = _Range(min_length, max_length)
+        self.columnar = columnar
+        if columnar and not isinstance(self.schema, (Schema, Object)):
+            raise ValueError("columnar arrays require an Object or Schema")
+        if columnar and getattr(self.schema, "object", self.schema).partial:
+            raise ValueError("columnar arrays can not contain partial objects")
+        self.bulk = self._bulk_types(self.schema)
+        self.packed = packed
+        if packed and self.bulk is None:
+            raise ValueError("packed arrays require an Int, Float or Bool")
+
+    @staticmethod
+    def _bulk_types(schema: Any) -> Union[frozenset, None]:
+        """
+        the exact value types allowed for arrays of plain Int, Float or Bool
+        with constant bounds, which are validated in bulk
+        """
+        if type(schema) not in (Int, Float, Bool):
+            return None
+        if schema.callback is not None or schema.default is not None:
+            return None
+        bounds = (schema.range.min, schema.range.max) if type(schema) != Bool else ()
+        if any(callable(bound) for bound in bounds):
+            return None
+        types = set(schema.types)
+        if int in types:
+            types.add(bool)
+        if schema.nullable:
+            types.add(type(None))
+        return frozenset(types)
+
+    def _valid_bulk(self, value: List) -> bool:
+        types = set(map(type, value))
+        if not types <= self.bulk:
+            return False
+        if type(self.schema) is Bool or not value:
+            return True
+        if type(None) in types:
+            # None is allowed but not comparable, leave it to the slow path
+            return False
+        minimum, maximum = self.schema.range.min, self.schema.range.max
+        if minimum is None and maximum is None:
+            return True
+        if float in types and any(item != item for item in value):
+            # nan is never in range but min and max would not notice
+            return False
+        if minimum is not None and min(value) < minimum:
+            return False
+        return maximum is None or max(value) <= maximum
+
+    def compile(self) -> "Array":
+        compile_property(self.schema)
+        return self
 
     def __call__(self, value: Union[List[Any], None]) -> Union[List[Any], None]:
         value = super(Array, self).__call__(value)
         if not self.range(value):
             raise errors.SchemaValidationError(f"value {value} is out of defined range")
-        for i in range(len(value)):
-            value[i] = self.schema(value[i])
+        if self.columnar:
+            return self._columns(value)
+        if self.bulk is not None and not profiler.active and self._valid_bulk(value):
+            return (
+                columns.pack(value, self.schema.column_type) if self.packed else value
+            )
+        if profiler.active:
+            for i in range(len(value)):
+                value[i] = profiler.field("*", self.schema, value[i])
+        else:
+            for i in range(len(value)):
+                value[i] = self.schema(value[i])
+        if self.packed:
+            return columns.pack(value, self.schema.column_type)
         return value
 
+    def _columns(self, value: List[Dict]) -> Dict[str, Any]:
+        prop = self.schema.object if isinstance(self.schema, Schema) else self.schema
+        column_types = {
+            key: getattr(func, "column_type", None) for key, func in prop.schema.items()
+        }
+        return columns.columns(prop.schema, column_types, prop._checked_item, value)
+
 
 class Choice(Property):
+
+    __slots__ = ("choices",)
+
     def __init__(self, choices: List[Any], **kwargs: Any):
         super(Choice, self).__init__(**kwargs)
         self.choices = choices
 
+    def compile(self) -> "Choice":
+        for choice in self.choices:
+            compile_property(choice)
+        return self
+
     def __call__(self, value: Any) -> Any:
         value = super(Choice, self).__call__(value)
         if value is None:
@@ -186,6 +519,9 @@ class Choice(Property):
 
 
 class Number(Property):
+
+    __slots__ = ("range",)
+
     def __init__(
         self,
         types: Tuple = (int, float),
@@ -204,16 +540,32 @@ class Number(Property):
 
 
 class Int(Number):
+
+    __slots__ = ()
+
+    # typecode and python type of the column for Array(..., columnar=True)
+    column_type = ("q", int)
+
     def __init__(self, **kwargs):
         super(Int, self).__init__((int,), **kwargs)
 
 
 class Float(Number):
+
+    __slots__ = ()
+
+    column_type = ("d", float)
+
     def __init__(self, **kwargs):
         super(Float, self).__init__((int, float), **kwargs)
 
 
 class Bool(Property):
+
+    __slots__ = ()
+
+    column_type = ("b", bool)
+
     def __init__(self, **kwargs):
         super(Bool, self).__init__(bool, **kwargs)
 
@@ -222,6 +574,9 @@ class Bool(Property):
 
 
 class String(Property):
+
+    __slots__ = ("range",)
+
     def __init__(
         self,
         min_length: Union[int, float, Callable] = None,
@@ -239,6 +594,9 @@ class String(Property):
 
 
 class Regex(String):
+
+    __slots__ = ("matcher",)
+
     def __init__(self, matcher: Union[Pattern, str], **kwargs):
         super(Regex, self).__init__(**kwargs)
         self.matcher = re.compile(matcher) if isinstance(matcher, str) else matcher
@@ -254,19 +612,25 @@ class Regex(String):
 
 
 class Email(Regex):
-    matcher = re.compile(".+@[^@]+.[^@]{2,}$")
+
+    __slots__ = ()
+
+    pattern = re.compile(".+@[^@]+.[^@]{2,}$")
 
     def __init__(self, **kwargs):
-        super(Email, self).__init__(self.matcher, **kwargs)
+        super(Email, self).__init__(self.pattern, **kwargs)
 
 
 class Uuid(Regex):
-    matcher = re.compile(
+
+    __slots__ = ("strip_hyphens",)
+
+    pattern = re.compile(
         "^[a-fA-F0-9]{8}-?[a-fA-F0-9]{4}-?[a-fA-F0-9]{4}-?[a-fA-F0-9]{4}-?[a-fA-F0-9]{12}$"
     )
 
     def __init__(self, strip_hyphens=False, **kwargs):
-        super(Uuid, self).__init__(self.matcher, **kwargs)
+        super(Uuid, self).__init__(self.pattern, **kwargs)
         self.strip_hyphens = strip_hyphens
 
     def __call__(self, value: Union[str, None]) -> Union[str, None]:
@@ -278,6 +642,8 @@ class Uuid(Regex):
 
 class Date(Property):
 
+    __slots__ = ("range",)
+
     date_format = "%Y-%m-%d"
 
     def __init__(
@@ -289,6 +655,11 @@ class Date(Property):
         super(Date, self).__init__(datetime.date, **kwargs)
         self.range = _Range(min_value, max_value)
 
+    def compile(self) -> "Date":
+        # the first strptime call imports _strptime and builds its format regex
+        self._parse_date("2000-01-01")
+        return self
+
     @classmethod
     def _parse_date(cls, value: str):
         if "T" in value:
@@ -328,6 +699,8 @@ class Date(Property):
 
 class DateTime(Property):
 
+    __slots__ = ("range",)
+
     timezone_matcher = re.compile(r"^.*?[+|\-][0-9]{2}:[0-9]{2}$")
     datetime_format = "%Y-%m-%dT%H:%M:%S.%f"
 
@@ -340,6 +713,10 @@ class DateTime(Property):
         super(DateTime, self).__init__(datetime.datetime, **kwargs)
         self.range = _Range(min_value, max_value)
 
+    def compile(self) -> "DateTime":
+        self._parse_datetime("2000-01-01T00:00:00.000000+01:00")
+        return self
+
     @classmethod
     def _parse_datetime(cls, value: str):
 
@@ -16,5 +16,6 @@ setuptools.setup(
     name=NAME,
     version=VERSION,
     install_requires=REQUIRES,
-    packages=setuptools.find_packages()
+    packages=setuptools.find_packages(exclude=['benchmarks', 'benchmarks.*']),
+    entry_points={'console_scripts': ['flapi-verify=flapi.jwt.cli:main']}
 )
@@ -1,9 +1,27 @@
 import unittest
 
-from flapi.core.rules import _CollectionRule
+from flapi.core.rules import AllOf, AnyOf, Callback, NoneOf, _CollectionRule
 
 
 class CollectionRuleTest(unittest.TestCase):
     def test_fails(self):
         rule = _CollectionRule()
         self.assertRaises(NotImplementedError, rule, "token")
+
+    def test_compile_flattens_same_rule(self):
+        first, second, third = (lambda _: True), (lambda _: True), (lambda _: False)
+        rule = AllOf(AllOf(first, AllOf(second)), third).compile()
+        self.assertEqual(rule.rules, (first, second, third))
+        self.assertFalse(rule({}))
+
+    def test_compile_keeps_other_rules(self):
+        inner = AnyOf(lambda _: False)
+        callback = Callback(lambda _: True)
+        rule = AllOf(inner, callback).compile()
+        self.assertEqual(rule.rules, (inner, callback))
+
+    def test_compile_none_of_is_not_flattened(self):
+        inner = NoneOf(lambda _: True)
+        rule = NoneOf(inner).compile()
+        self.assertEqual(rule.rules, (inner,))
+        self.assertTrue(rule({}))
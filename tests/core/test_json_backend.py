@@ -0,0 +1,83 @@
+import datetime
+import json
+import unittest
+
+import flask
+
+from flapi.core import json_backend
+from flapi.jwt.builder import Builder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class SetBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(json_backend.set_backend, "json")
+
+    def test_default(self):
+        self.assertIs(type(json_backend.backend), json_backend.Backend)
+        self.assertIsNone(json_backend.encoder_class())
+
+    def test_by_name(self):
+        self.assertEqual(json_backend.set_backend("json").name, "json")
+        self.assertRaises(ValueError, json_backend.set_backend, "nope")
+
+    def test_by_instance(self):
+        backend = json_backend.Backend()
+        self.assertIs(json_backend.set_backend(backend), backend)
+        self.assertIs(json_backend.backend, backend)
+
+    def test_auto(self):
+        backend = json_backend.set_backend("auto")
+        self.assertEqual(backend.name, "json" if orjson is None else "orjson")
+
+    def test_stdlib(self):
+        self.assertEqual(json_backend.dumps({"a": [1, None]}), '{"a":[1,null]}')
+        self.assertEqual(json_backend.loads(b'{"a": 1}'), {"a": 1})
+        self.assertEqual(
+            json_backend.dumps(datetime.date(2019, 1, 1), default=str), '"2019-01-01"'
+        )
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class OrjsonBackendTest(unittest.TestCase):
+    def setUp(self):
+        json_backend.set_backend("orjson")
+        self.addCleanup(json_backend.set_backend, "json")
+        self.app = flask.Flask(__name__)
+        self.app.testing = True
+
+        @self.app.route("/", methods=["POST"])
+        def view():
+            first = json_backend.request_json(flask.request)
+            second = json_backend.request_json(flask.request)
+            return {"same": first is second, "body": first}
+
+    def test_dumps_and_loads(self):
+        value = {"a": [1, 2.5, None, "é"]}
+        self.assertEqual(json.loads(json_backend.dumps(value)), value)
+        self.assertEqual(json_backend.loads(json_backend.dumps(value)), value)
+        self.assertRaises(ValueError, json_backend.loads, "{")
+
+    def test_request_json(self):
+        response = self.app.test_client().post("/", json={"a": 1})
+        self.assertEqual(response.get_json(), {"same": True, "body": {"a": 1}})
+
+    def test_request_not_json(self):
+        response = self.app.test_client().post("/", data="a=1")
+        self.assertEqual(response.get_json(), {"same": True, "body": None})
+
+    def test_request_invalid_json(self):
+        response = self.app.test_client().post(
+            "/", data="{", content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_builder_encodes_with_backend(self):
+        self.assertIs(json_backend.encoder_class(), json_backend._Encoder)
+        builder = Builder("secret", 60)
+        token = builder.encode({"sub": "me", "scp": ["a"]})
+        self.assertEqual(builder.decode(token)["scp"], ["a"])
@@ -0,0 +1,144 @@
+import unittest
+import unittest.mock
+
+import flask
+
+from flapi.core import metrics
+from flapi.jwt.builder import Builder
+from flapi.jwt.protect import Protect as JwtProtect
+from flapi.schema.errors import SchemaValidationError
+from flapi.schema.protect import Protect as SchemaProtect
+from flapi.schema.types import Bool, Schema
+
+
+class CounterTest(unittest.TestCase):
+    def test_inc(self):
+        counter = metrics.Counter("things_total", "things")
+        counter.inc(result="a")
+        counter.inc(2, result="a")
+        counter.inc(result="b")
+        self.assertEqual(counter.get(result="a"), 3)
+        self.assertEqual(counter.get(result="b"), 1)
+        self.assertEqual(counter.get(result="c"), 0)
+
+
+class HistogramTest(unittest.TestCase):
+    def test_buckets(self):
+        histogram = metrics.Histogram("took", "took", buckets=(1, 2))
+        for value in (0.5, 1, 1.5, 3):
+            histogram.observe(value)
+        samples = {
+            (name, dict(labels).get("le")): value
+            for name, labels, value in histogram.samples()
+        }
+        self.assertEqual(samples[("took_bucket", "1")], 2)
+        self.assertEqual(samples[("took_bucket", "2")], 3)
+        self.assertEqual(samples[("took_bucket", "+Inf")], 4)
+        self.assertEqual(samples[("took_sum", None)], 6)
+        self.assertEqual(samples[("took_count", None)], 4)
+
+    def test_quantiles(self):
+        histogram = metrics.Histogram("took", "took")
+        for value in range(1, 101):
+            histogram.observe(value, route="a")
+        self.assertEqual(histogram.quantile(0.5, route="a"), 51)
+        self.assertEqual(histogram.quantile(0.99, route="a"), 100)
+        self.assertIsNone(histogram.quantile(0.5, route="b"))
+
+    def test_window(self):
+        histogram = metrics.Histogram("took", "took", window=10)
+        for value in range(100):
+            histogram.observe(value)
+        self.assertEqual(histogram.quantile(0, **{}), 90)
+
+    def test_observe_since_disabled(self):
+        histogram = metrics.Histogram("took", "took")
+        histogram.observe_since(None)
+        self.assertEqual(histogram.samples(), [])
+
+
+class RegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = metrics.Registry()
+
+    def test_get_or_create(self):
+        counter = self.registry.counter("a_total", "a")
+        self.assertIs(self.registry.counter("a_total", "a"), counter)
+        self.assertRaises(ValueError, self.registry.histogram, "a_total", "a")
+
+    def test_clock(self):
+        self.assertIsNone(self.registry.clock())
+        self.registry.enabled = True
+        self.assertIsNotNone(self.registry.clock())
+
+    def test_render(self):
+        self.registry.counter("a_total", "some a").inc(result='say "hi"')
+        self.registry.histogram("b_seconds", "some b", buckets=(1,)).observe(0.5)
+        text = self.registry.render()
+        self.assertIn("# HELP a_total some a\n# TYPE a_total counter\n", text)
+        self.assertIn('a_total{result="say \\"hi\\""} 1\n', text)
+        self.assertIn('b_seconds_bucket{le="1"} 1\n', text)
+        self.assertIn('b_seconds_bucket{le="+Inf"} 1\n', text)
+        self.assertIn("b_seconds_count 1\n", text)
+        self.assertIn('b_seconds_quantile{quantile="0.99"} 0.5\n', text)
+
+    def test_clear(self):
+        counter = self.registry.counter("a_total", "a")
+        counter.inc()
+        self.registry.clear()
+        self.assertEqual(counter.get(), 0)
+
+    def test_endpoint(self):
+        app = flask.Flask(__name__)
+        self.registry.init_app(app)
+        self.assertTrue(self.registry.enabled)
+        self.registry.counter("a_total", "a").inc()
+        response = app.test_client().get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain"))
+        self.assertIn(b"a_total 1", response.data)
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self):
+        metrics.registry.clear()
+        metrics.registry.enabled = True
+        self.addCleanup(setattr, metrics.registry, "enabled", False)
+
+    def metric(self, name):
+        return metrics.registry.metrics[name]
+
+    def test_decode(self):
+        builder = Builder("secret", 60)
+        builder.decode(builder.encode({"sub": "a"}))
+        self.assertRaises(Exception, builder.decode, "nope")
+        total = self.metric("flapi_jwt_decode_total")
+        self.assertEqual(total.get(result="success"), 1)
+        self.assertEqual(total.get(result="DecodeError"), 1)
+        self.assertGreater(self.metric("flapi_jwt_decode_seconds").quantile(0.5), 0)
+
+    def test_rules(self):
+        def route():
+            return True
+
+        with unittest.mock.patch.object(Builder, "current_token", lambda: "token"):
+            JwtProtect(lambda t: True)(route)()
+        histogram = self.metric("flapi_jwt_rules_seconds")
+        self.assertIsNotNone(histogram.quantile(0.5, route=route.__qualname__))
+
+    def test_schema(self):
+        class Thing(Schema):
+            test = Bool(nullable=False)
+
+        protected = SchemaProtect(Thing)(lambda body: body)
+        with unittest.mock.patch.object(
+            flask, "request", unittest.mock.Mock(json={"test": True})
+        ):
+            protected()
+        with unittest.mock.patch.object(
+            flask, "request", unittest.mock.Mock(json={"test": None})
+        ):
+            self.assertRaises(SchemaValidationError, protected)
+        total = self.metric("flapi_schema_validation_total")
+        self.assertEqual(total.get(schema="Thing", result="valid"), 1)
+        self.assertEqual(total.get(schema="Thing", result="invalid"), 1)
@@ -0,0 +1,92 @@
+import unittest
+import unittest.mock
+
+import flask
+
+from flapi.core import tracing
+from flapi.jwt.app import FlaskJwt
+from flapi.jwt.builder import Builder
+from flapi.jwt.protect import Protect as JwtProtect
+from flapi.schema.protect import Protect as SchemaProtect
+from flapi.schema.types import Bool, Schema
+
+
+class InMemoryTracerTest(unittest.TestCase):
+    def test_nested_spans(self):
+        tracer = tracing.InMemoryTracer()
+        with tracer.span("outer", a=1) as outer:
+            with tracer.span("inner") as inner:
+                inner.set_attribute("b", 2)
+        self.assertEqual(tracer.names(), ["inner", "outer"])
+        self.assertIs(inner.parent, outer)
+        self.assertEqual(outer.attributes, {"a": 1})
+        self.assertEqual(inner.attributes, {"b": 2})
+        self.assertGreaterEqual(outer.duration, inner.duration)
+
+    def test_records_error(self):
+        tracer = tracing.InMemoryTracer()
+        with self.assertRaises(ValueError):
+            with tracer.span("failing"):
+                raise ValueError("nope")
+        self.assertIsInstance(tracer.spans[0].error, ValueError)
+
+    def test_open_telemetry(self):
+        otel = unittest.mock.Mock()
+        tracer = tracing.OpenTelemetryTracer(otel)
+        self.assertIs(tracer.span("a", b=1), otel.start_as_current_span.return_value)
+        otel.start_as_current_span.assert_called_once_with("a", attributes={"b": 1})
+
+    def test_tracer_interface(self):
+        self.assertRaises(NotImplementedError, tracing.Tracer().span, "a")
+
+
+class TracedTest(unittest.TestCase):
+    def setUp(self):
+        self.tracer = tracing.InMemoryTracer()
+        self.addCleanup(tracing.set_tracer, None)
+
+    def test_without_tracer(self):
+        func = tracing.traced("thing")(lambda: 1)
+        self.assertEqual(func(), 1)
+        self.assertEqual(self.tracer.spans, [])
+
+    def test_with_tracer(self):
+        tracing.set_tracer(self.tracer)
+        func = tracing.traced("thing")(lambda: 1)
+        self.assertEqual(func(), 1)
+        self.assertEqual(self.tracer.names(), ["thing"])
+
+    def test_request_stages(self):
+        tracing.set_tracer(self.tracer)
+        handler = FlaskJwt("secret", 60)
+        token = handler.encode({"sub": "abc"})
+
+        class Thing(Schema):
+            test = Bool()
+
+        app = flask.Flask(__name__)
+        handler.init_app(app)
+
+        @app.route("/", methods=["POST"])
+        @JwtProtect(lambda t: True)
+        @SchemaProtect(Thing)
+        def view(body):
+            return flask.jsonify(body)
+
+        response = app.test_client().post(
+            "/", json={"test": True}, headers={"Authorization": f"Bearer {token}"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.tracer.names(),
+            [
+                "flapi.jwt.decode",
+                "flapi.jwt.pre_request",
+                "flapi.jwt.protect",
+                "flapi.schema.request_body",
+                "flapi.jwt.post_request",
+            ],
+        )
+        decode, pre_request = self.tracer.spans[:2]
+        self.assertIs(decode.parent, pre_request)
+        self.assertEqual(self.tracer.spans[2].attributes, {"route": view.__qualname__})
@@ -0,0 +1,78 @@
+import datetime
+import gc
+import unittest
+import unittest.mock
+
+import flask
+
+import flapi
+from flapi.core import rules
+from flapi.core.warmup import protections, warmup
+from flapi.jwt.protect import Protect as JwtProtect
+from flapi.schema import types
+from flapi.schema.protect import Protect as SchemaProtect
+
+
+class Thing(types.Schema):
+    when = types.Date()
+    items = types.Array(types.DateTime)
+
+
+class WarmupTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask(__name__)
+        self.schema_protect = SchemaProtect(Thing)
+        self.jwt_protect = JwtProtect(rules.AllOf(lambda _: True))
+
+        @self.app.route("/", methods=["POST"])
+        @self.jwt_protect
+        @self.schema_protect
+        def view(body):
+            return ""
+
+        @self.app.route("/open")
+        def open_view():
+            return ""
+
+        self.view = view
+
+    def test_protections(self):
+        self.assertEqual(
+            protections(self.view), [self.jwt_protect, self.schema_protect]
+        )
+        self.assertEqual(protections(lambda: None), [])
+
+    def test_warmup_compiles(self):
+        with unittest.mock.patch.object(
+            types.Date, "compile", autospec=True
+        ) as date, unittest.mock.patch.object(
+            types.DateTime, "compile", autospec=True
+        ) as date_time:
+            self.assertEqual(warmup(self.app, freeze=False), 2)
+        date.assert_called_once_with(Thing.when)
+        date_time.assert_called_once()
+        self.assertEqual(len(self.jwt_protect.checks.rules), 1)
+        self.assertIsInstance(self.jwt_protect.checks.rules[0], type(lambda: 0))
+
+    @unittest.skipUnless(hasattr(gc, "freeze"), "gc.freeze requires python 3.7")
+    def test_warmup_freezes(self):
+        self.addCleanup(gc.unfreeze)
+        warmup(self.app)
+        self.assertGreater(gc.get_freeze_count(), 0)
+
+    def test_exposed_on_flapi(self):
+        self.assertIs(flapi.warmup, warmup)
+
+
+class CompileTest(unittest.TestCase):
+    def test_date_compile_primes_parser(self):
+        prop = types.Date()
+        self.assertIs(prop.compile(), prop)
+        self.assertEqual(prop("2019-01-02"), datetime.date(2019, 1, 2))
+
+    def test_compile_property(self):
+        schema = Thing()
+        with unittest.mock.patch.object(types.Object, "compile") as compile_object:
+            self.assertIs(types.compile_property(schema), schema)
+        compile_object.assert_called_once_with()
+        self.assertEqual(types.compile_property(len), len)
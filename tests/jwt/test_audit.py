@@ -0,0 +1,111 @@
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+import flask
+
+from flapi.jwt.app import FlaskJwt
+from flapi.jwt.audit import AuditLog
+
+
+class AuditLogTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "audit.log")
+
+    def read(self, path=None):
+        with open(path or self.path) as stream:
+            return [json.loads(line) for line in stream]
+
+    def test_writes_records(self):
+        audit = AuditLog(self.path, flush_interval=60)
+        audit.record({"sub": "abc", "jti": "123"}, "GET", "/thing", 200)
+        audit.close()
+        records = self.read()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["sub"], "abc")
+        self.assertEqual(records[0]["jti"], "123")
+        self.assertEqual(records[0]["path"], "/thing")
+        self.assertEqual(records[0]["status"], 200)
+        self.assertEqual((audit.recorded, audit.written), (1, 1))
+
+    def test_background_flush(self):
+        audit = AuditLog(self.path, flush_interval=0.01)
+        self.addCleanup(audit.close)
+        audit.record({"sub": "abc"}, "GET", "/thing")
+        for _ in range(500):
+            if audit.written:
+                break
+            audit._stop.wait(0.01)
+        self.assertEqual(len(self.read()), 1)
+
+    def test_drops_when_full(self):
+        audit = AuditLog(self.path, flush_interval=60, max_queue=2)
+        with unittest.mock.patch.object(audit, "_ensure_writer"):
+            results = [audit.record({}, "GET", "/", 200) for _ in range(3)]
+        self.assertEqual(results, [True, True, False])
+        self.assertEqual(audit.dropped, 1)
+        self.assertEqual(audit.flush(), 2)
+
+    def test_keeps_records_when_write_fails(self):
+        audit = AuditLog(self.path, flush_interval=60, batch_size=2)
+        with unittest.mock.patch.object(audit, "_ensure_writer"):
+            for i in range(3):
+                audit.record({"sub": str(i)}, "GET", "/", 200)
+        with unittest.mock.patch("builtins.open", side_effect=OSError("disk full")):
+            self.assertRaises(OSError, audit.flush)
+        self.assertEqual((audit.failed, audit.written, len(audit.queue)), (2, 0, 3))
+        self.assertEqual(audit.flush(), 3)
+        self.assertEqual([record["sub"] for record in self.read()], ["0", "1", "2"])
+
+    def test_writer_survives_failures(self):
+        audit = AuditLog(self.path, flush_interval=0.01)
+        self.addCleanup(audit.close)
+        with unittest.mock.patch.object(audit, "_write", side_effect=OSError):
+            with self.assertLogs("flapi.jwt.audit", "ERROR") as logs:
+                audit.record({"sub": "abc"}, "GET", "/thing")
+                for _ in range(500):
+                    if logs.records:
+                        break
+                    audit._stop.wait(0.01)
+        for _ in range(500):
+            if audit.written:
+                break
+            audit._stop.wait(0.01)
+        self.assertTrue(audit._thread.is_alive())
+        self.assertEqual(len(self.read()), 1)
+
+    def test_rotates(self):
+        audit = AuditLog(self.path, max_bytes=200, backup_count=2, batch_size=1)
+        with unittest.mock.patch.object(audit, "_ensure_writer"):
+            for i in range(10):
+                audit.record({"sub": str(i)}, "GET", "/", 200)
+        audit.flush()
+        self.assertTrue(os.path.exists(f"{self.path}.1"))
+        self.assertTrue(os.path.exists(f"{self.path}.2"))
+        self.assertFalse(os.path.exists(f"{self.path}.3"))
+        self.assertEqual(self.read()[-1]["sub"], "9")
+        self.assertLessEqual(os.path.getsize(self.path), 200)
+
+
+class FlaskJwtAuditTest(unittest.TestCase):
+    def test_post_request_callback_records(self):
+        app = flask.Flask(__name__)
+        audit = unittest.mock.Mock()
+        handler = FlaskJwt("secret", 60, audit=audit)
+        with app.test_request_context("/thing", method="POST"):
+            handler.store.set({"sub": "abc"})
+            handler.post_request_callback(flask.Response(status=201))
+        audit.record.assert_called_once_with({"sub": "abc"}, "POST", "/thing", 201)
+
+    def test_post_request_callback_without_token(self):
+        app = flask.Flask(__name__)
+        audit = unittest.mock.Mock()
+        handler = FlaskJwt("secret", 60, audit=audit)
+        with app.test_request_context("/thing"):
+            handler.store.set(None)
+            handler.post_request_callback(flask.Response())
+        audit.record.assert_not_called()
@@ -0,0 +1,96 @@
+import threading
+import unittest
+import unittest.mock
+
+from flapi.jwt.builder import Builder
+from flapi.jwt.cache import TokenCache
+
+
+class TokenCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.builder = Builder("secret", 100)
+        self.now = 1000.0
+        patcher = unittest.mock.patch("time.time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def decode(self, token):
+        return self.builder.decode(token, verify=False)
+
+    def test_invalid_ratio(self):
+        self.assertRaises(ValueError, TokenCache, self.builder, 0)
+        self.assertRaises(ValueError, TokenCache, self.builder, 1.5)
+
+    def test_mints_token(self):
+        token = self.decode(self.builder.service_token("svc", ["read:a"], "other"))
+        self.assertEqual(token["sub"], "svc")
+        self.assertEqual(token["scp"], ["read:a"])
+        self.assertEqual(token["aud"], "other")
+        self.assertEqual(token["exp"], 1100.0)
+
+    def test_reuses_token(self):
+        first = self.builder.service_token("svc", ["read:a", "write:a"])
+        self.now += 50
+        self.assertEqual(
+            self.builder.service_token("svc", ["write:a", "read:a"]), first
+        )
+
+    def test_keyed_by_subject_scopes_and_audience(self):
+        token = self.builder.service_token("svc", ["read:a"], "one")
+        self.assertNotEqual(
+            self.builder.service_token("other", ["read:a"], "one"), token
+        )
+        self.assertNotEqual(self.builder.service_token("svc", ["read:b"], "one"), token)
+        self.assertNotEqual(self.builder.service_token("svc", ["read:a"], "two"), token)
+
+    def test_refreshes_in_background(self):
+        cache = TokenCache(self.builder, 0.5)
+        first = cache.get("svc")
+        self.now += 60
+        started = threading.Event()
+        with unittest.mock.patch.object(
+            threading.Thread, "start", lambda thread: (started.set(), thread.run())
+        ):
+            self.assertEqual(cache.get("svc"), first)
+        self.assertTrue(started.is_set())
+        second = cache.get("svc")
+        self.assertNotEqual(second, first)
+        self.assertEqual(self.decode(second)["exp"], 1160.0)
+
+    def test_refreshes_synchronously_when_expired(self):
+        cache = TokenCache(self.builder, 0.5)
+        first = cache.get("svc")
+        self.now += 100
+        self.assertNotEqual(cache.get("svc"), first)
+
+    def test_refreshes_synchronously_without_background(self):
+        cache = TokenCache(self.builder, 0.5, background=False)
+        first = cache.get("svc")
+        self.now += 60
+        self.assertNotEqual(cache.get("svc"), first)
+
+    def test_single_flight(self):
+        cache = TokenCache(self.builder)
+        calls = []
+        encode = self.builder.encode
+
+        def slow_encode(*args, **kwargs):
+            calls.append(1)
+            return encode(*args, **kwargs)
+
+        with unittest.mock.patch.object(self.builder, "encode", slow_encode):
+            threads = [
+                threading.Thread(target=cache.get, args=("svc",)) for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(calls), 1)
+
+    def test_clear(self):
+        cache = TokenCache(self.builder)
+        first = cache.get("svc")
+        cache.clear()
+        self.now += 1
+        self.assertNotEqual(cache.get("svc"), first)
@@ -0,0 +1,81 @@
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+import unittest.mock
+
+from flapi.jwt import cli
+from flapi.jwt.builder import Builder
+
+
+class CliTest(unittest.TestCase):
+
+    secret = "secret"
+    settings = {"secret": secret, "lifespan": 0, "algorithm": "HS256"}
+
+    def token(self, lifespan=60, secret=secret):
+        return Builder(secret, lifespan).encode({"sub": "someone"})
+
+    def run_cli(self, lines, processes=1, options=None):
+        output = io.StringIO()
+        stats = cli.run(
+            [io.StringIO("\n".join(lines))], output, self.settings, options, processes
+        )
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        return stats, results
+
+    def test_valid_token(self):
+        stats, results = self.run_cli([self.token()])
+        self.assertEqual(stats["valid"], 1)
+        self.assertTrue(results[0]["valid"])
+        self.assertEqual(results[0]["claims"]["sub"], "someone")
+        self.assertIsNone(results[0]["error"])
+
+    def test_strips_bearer_prefix_and_blank_lines(self):
+        stats, results = self.run_cli(["", f"Bearer {self.token()}", "  "])
+        self.assertEqual(stats["total"], 1)
+        self.assertEqual(results[0]["line"], 2)
+        self.assertTrue(results[0]["valid"])
+
+    def test_invalid_signature_still_reports_claims(self):
+        stats, results = self.run_cli([self.token(secret="other")])
+        self.assertEqual(stats["invalid"], 1)
+        self.assertFalse(results[0]["valid"])
+        self.assertEqual(results[0]["claims"]["sub"], "someone")
+        self.assertIsNotNone(results[0]["error"])
+
+    def test_malformed_token(self):
+        stats, results = self.run_cli(["not.a.token"])
+        self.assertFalse(results[0]["valid"])
+        self.assertIsNone(results[0]["claims"])
+
+    def test_expired_token(self):
+        token = self.token(lifespan=-10)
+        _, results = self.run_cli([token])
+        self.assertFalse(results[0]["valid"])
+        _, results = self.run_cli([token], options={"verify_exp": False})
+        self.assertTrue(results[0]["valid"])
+
+    def test_pool_preserves_order(self):
+        tokens = [self.token(), self.token(secret="other")] * 5
+        stats, results = self.run_cli(tokens, processes=2)
+        self.assertEqual(stats["total"], 10)
+        self.assertEqual([r["line"] for r in results], list(range(1, 11)))
+        self.assertEqual([r["valid"] for r in results], [True, False] * 5)
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "tokens.log")
+            target = os.path.join(directory, "results.ndjson")
+            with open(source, "w") as stream:
+                stream.write(f"{self.token()}\n{self.token(secret='other')}\n")
+            with unittest.mock.patch("sys.stderr", io.StringIO()) as stderr:
+                code = cli.main([source, "--secret", self.secret, "--output", target])
+            with open(target) as stream:
+                results = [json.loads(line) for line in stream]
+
+        self.assertEqual(code, 0)
+        self.assertEqual([r["valid"] for r in results], [True, False])
+        self.assertIn("2 tokens (1 valid, 1 invalid)", stderr.getvalue())
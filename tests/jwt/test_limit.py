@@ -0,0 +1,105 @@
+import multiprocessing
+import unittest
+import unittest.mock
+
+import flask
+import jwt
+
+from flapi.jwt.app import FlaskJwt
+from flapi.jwt.limit import LocalBuckets, RateLimit, SharedBuckets
+
+
+class LocalBucketsTest(unittest.TestCase):
+    def test_burst_then_limited(self):
+        buckets = LocalBuckets()
+        results = [buckets.take("a", 1, 3, 0) for _ in range(4)]
+        self.assertEqual(results, [True, True, True, False])
+
+    def test_lazy_refill(self):
+        buckets = LocalBuckets()
+        buckets.take("a", 2, 1, 0)
+        self.assertFalse(buckets.take("a", 2, 1, 0.25))
+        self.assertTrue(buckets.take("a", 2, 1, 0.75))
+
+    def test_refill_capped_at_capacity(self):
+        buckets = LocalBuckets()
+        buckets.take("a", 1, 2, 0)
+        results = [buckets.take("a", 1, 2, 100) for _ in range(3)]
+        self.assertEqual(results, [True, True, False])
+
+    def test_keys_are_independent(self):
+        buckets = LocalBuckets()
+        buckets.take("a", 1, 1, 0)
+        self.assertFalse(buckets.take("a", 1, 1, 0))
+        self.assertTrue(buckets.take("b", 1, 1, 0))
+
+    def test_evicts_least_recently_used(self):
+        buckets = LocalBuckets(max_keys=2)
+        buckets.take("a", 1, 1, 0)
+        buckets.take("b", 1, 1, 0)
+        buckets.take("a", 1, 1, 0)
+        buckets.take("c", 1, 1, 0)
+        self.assertEqual(list(buckets.buckets), ["a", "c"])
+
+
+class SharedBucketsTest(unittest.TestCase):
+    def test_burst_then_limited(self):
+        buckets = SharedBuckets(slots=16)
+        results = [buckets.take("a", 1, 2, 0) for _ in range(3)]
+        self.assertEqual(results, [True, True, False])
+        self.assertTrue(buckets.take("a", 1, 2, 1))
+
+    def test_shared_with_forked_process(self):
+        buckets = SharedBuckets(slots=16)
+        context = multiprocessing.get_context("fork")
+        process = context.Process(target=buckets.take, args=("a", 1, 1, 0))
+        process.start()
+        process.join()
+        self.assertFalse(buckets.take("a", 1, 1, 0))
+
+    def test_collision_shares_bucket(self):
+        buckets = SharedBuckets(slots=1)
+        results = [buckets.take(key, 0.001, 1, 0) for key in ("a", "b", "a", "b")]
+        self.assertEqual(results, [True, False, False, False])
+
+    def test_ways_keep_keys_apart(self):
+        buckets = SharedBuckets(slots=2, ways=2)
+        self.assertEqual(buckets.table.sets, 1)
+        results = [buckets.take(key, 0.001, 1, 0) for key in ("a", "b", "a", "b")]
+        self.assertEqual(results, [True, True, False, False])
+
+
+class RateLimitTest(unittest.TestCase):
+    def test_invalid_rate(self):
+        self.assertRaises(ValueError, RateLimit, 0)
+
+    def test_default_capacity(self):
+        self.assertEqual(RateLimit(5).capacity, 5)
+        self.assertEqual(RateLimit(0.1).capacity, 1)
+
+    def test_keyed_by_claim(self):
+        limit = RateLimit(1, claim="azp")
+        self.assertTrue(limit({"azp": "client", "sub": "a"}))
+        self.assertFalse(limit({"azp": "client", "sub": "b"}))
+
+    def test_missing_claim(self):
+        limit = RateLimit(1)
+        self.assertTrue(limit({}))
+        self.assertTrue(limit({}))
+
+
+class FlaskJwtRateLimitTest(unittest.TestCase):
+    class FakeError(jwt.PyJWTError):
+        pass
+
+    def test_rate_limited(self):
+        app = flask.Flask(__name__)
+        handler = FlaskJwt("secret", 60, rate_limit=RateLimit(1))
+        handler.rate_limit_error = self.FakeError
+        with app.app_context(), unittest.mock.patch.object(
+            handler, "decode", lambda *_: {"sub": "abc"}
+        ), unittest.mock.patch(
+            "flask.request", unittest.mock.Mock(headers={"Authorization": "Bearer abc"})
+        ):
+            handler.pre_request_callback()
+            self.assertRaises(self.FakeError, handler.pre_request_callback)
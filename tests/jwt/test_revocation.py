@@ -0,0 +1,148 @@
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+import flask
+import jwt
+
+from flapi.jwt.app import FlaskJwt
+from flapi.jwt.revocation import BloomFilter, FileSource, RevocationList
+
+
+class BloomFilterTest(unittest.TestCase):
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, BloomFilter, 0)
+        self.assertRaises(ValueError, BloomFilter, 10, 1)
+
+    def test_contains(self):
+        bloom = BloomFilter(1000)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+        self.assertTrue(all(f"jti-{i}" in bloom for i in range(1000)))
+
+    def test_false_positive_rate(self):
+        bloom = BloomFilter(1000, 0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+
+class FileSourceTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "revoked")
+
+    def write(self, data, mode="a"):
+        with open(self.path, mode) as stream:
+            stream.write(data)
+
+    def test_missing_file(self):
+        self.assertEqual(FileSource(self.path)(None), ([], 0))
+
+    def test_incremental(self):
+        source = FileSource(self.path)
+        self.write("one\ntwo\nthr")
+        jtis, cursor = source(None)
+        self.assertEqual(jtis, ["one", "two"])
+        self.write("ee\n\nfour\n")
+        jtis, cursor = source(cursor)
+        self.assertEqual(jtis, ["three", "four"])
+        self.assertEqual(source(cursor)[0], [])
+
+    def test_truncated(self):
+        source = FileSource(self.path)
+        self.write("one\ntwo\n")
+        _, cursor = source(None)
+        self.write("x\n", "w")
+        self.assertEqual(source(cursor)[0], ["x"])
+
+
+class RevocationListTest(unittest.TestCase):
+    def test_empty(self):
+        revoked = RevocationList()
+        self.assertFalse(revoked({"jti": "abc"}))
+        self.assertFalse(revoked({}))
+
+    def test_add(self):
+        revoked = RevocationList()
+        revoked.add("abc")
+        self.assertTrue(revoked({"jti": "abc"}))
+        self.assertFalse(revoked({"jti": "def"}))
+
+    def test_grows(self):
+        revoked = RevocationList(capacity=10)
+        revoked.add(*(str(i) for i in range(25)))
+        self.assertEqual(revoked.bloom.capacity, 40)
+        self.assertTrue(all(revoked.is_revoked(str(i)) for i in range(25)))
+
+    def test_lookup_only_consulted_on_bloom_hit(self):
+        lookup = unittest.mock.Mock(return_value=True)
+        revoked = RevocationList(lookup=lookup)
+        revoked.add("abc")
+        self.assertFalse(revoked.is_revoked("def"))
+        lookup.assert_not_called()
+        self.assertTrue(revoked.is_revoked("abc"))
+        lookup.assert_called_once_with("abc")
+        self.assertEqual(revoked.revoked, set())
+
+    def test_source(self):
+        source = unittest.mock.Mock(side_effect=[(["a"], 1), (["b"], 2)])
+        revoked = RevocationList(source)
+        self.assertTrue(revoked.is_revoked("a"))
+        self.assertFalse(revoked.is_revoked("b"))
+        revoked.refresh()
+        self.assertTrue(revoked.is_revoked("b"))
+        source.assert_called_with(1)
+
+    def test_file_source(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".revoked") as stream:
+            stream.write("abc\n")
+            stream.flush()
+            self.assertTrue(RevocationList(stream.name).is_revoked("abc"))
+
+    def test_start_without_source(self):
+        self.assertRaises(ValueError, RevocationList().start, 1)
+
+    def test_background_refresh(self):
+        source = unittest.mock.Mock(return_value=([], None))
+        revoked = RevocationList(source, refresh_interval=0.01)
+        self.addCleanup(revoked.stop)
+        source.side_effect = [(["late"], 1)] + [([], 1)] * 1000
+        for _ in range(500):
+            if revoked.is_revoked("late"):
+                break
+            revoked._stop.wait(0.01)
+        self.assertTrue(revoked.is_revoked("late"))
+
+
+class FlaskJwtRevocationTest(unittest.TestCase):
+    class FakeError(jwt.PyJWTError):
+        pass
+
+    def setUp(self):
+        self.app = flask.Flask(__name__)
+        self.revoked = RevocationList()
+        self.jwt = FlaskJwt("secret", 60, app=self.app, revocation=self.revoked)
+        self.jwt.validation_error = self.FakeError
+
+    def request(self, token):
+        return unittest.mock.patch(
+            "flask.request",
+            unittest.mock.Mock(headers={"Authorization": "Bearer abc"}),
+        ), unittest.mock.patch.object(self.jwt, "decode", lambda *_: token)
+
+    def test_not_revoked(self):
+        request, decode = self.request({"jti": "abc"})
+        with self.app.app_context(), request, decode:
+            self.jwt.pre_request_callback()
+            self.assertEqual(self.jwt.current_token(), {"jti": "abc"})
+
+    def test_revoked(self):
+        self.revoked.add("abc")
+        request, decode = self.request({"jti": "abc"})
+        with self.app.app_context(), request, decode:
+            self.assertRaises(self.FakeError, self.jwt.pre_request_callback)
+            self.assertIsNone(self.jwt.current_token())
@@ -0,0 +1,122 @@
+import multiprocessing
+import time
+import unittest
+import unittest.mock
+
+import flask
+
+from flapi.jwt.app import FlaskJwt
+from flapi.jwt.shared import SharedTable, SharedTokenCache
+
+
+class SharedTableTest(unittest.TestCase):
+    def setUp(self):
+        self.table = SharedTable(slots=16, slot_size=64, stripes=4)
+        self.digest = self.table.digest("key")
+
+    def test_slot_too_small(self):
+        self.assertRaises(ValueError, SharedTable, 4, SharedTable.header.size)
+
+    def test_missing(self):
+        self.assertIsNone(self.table.get(self.digest))
+
+    def test_set_and_get(self):
+        self.assertTrue(self.table.set(self.digest, b"value", time.time() + 10))
+        self.assertEqual(self.table.get(self.digest), b"value")
+
+    def test_expired(self):
+        self.table.set(self.digest, b"value", 100)
+        self.assertEqual(self.table.get(self.digest, now=99), b"value")
+        self.assertIsNone(self.table.get(self.digest, now=100))
+
+    def test_value_too_large(self):
+        self.assertFalse(self.table.set(self.digest, bytes(64), time.time() + 10))
+        self.assertIsNone(self.table.get(self.digest))
+
+    def test_delete_and_clear(self):
+        self.table.set(self.digest, b"value", time.time() + 10)
+        self.table.delete(self.digest)
+        self.assertIsNone(self.table.get(self.digest))
+        self.table.set(self.digest, b"value", time.time() + 10)
+        self.table.clear()
+        self.assertIsNone(self.table.get(self.digest))
+
+    def test_ways(self):
+        table = SharedTable(slots=2, slot_size=64, stripes=1, ways=2)
+        table.set(table.digest("a"), b"a", time.time() + 10)
+        table.set(table.digest("b"), b"b", time.time() + 20)
+        self.assertEqual(table.get(table.digest("a")), b"a")
+        self.assertEqual(table.get(table.digest("b")), b"b")
+        # a full set replaces the entry expiring first
+        table.set(table.digest("c"), b"c", time.time() + 10)
+        self.assertIsNone(table.get(table.digest("a")))
+        self.assertEqual(table.get(table.digest("b")), b"b")
+
+    def test_update_collision(self):
+        table = SharedTable(slots=1, slot_size=64, stripes=1)
+        table.update(table.digest("a"), lambda current: (b"a", 100), now=0)
+        seen = []
+        table.update(
+            table.digest("b"), lambda current: (seen.append(current) or b"b", 100), 0
+        )
+        self.assertEqual(seen, [b"a"])
+
+    def test_shared_with_forked_process(self):
+        context = multiprocessing.get_context("fork")
+        process = context.Process(
+            target=self.table.set, args=(self.digest, b"child", time.time() + 10)
+        )
+        process.start()
+        process.join()
+        self.assertEqual(self.table.get(self.digest), b"child")
+
+
+class SharedTokenCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = SharedTokenCache(slots=16)
+
+    def test_round_trip(self):
+        claims = {"sub": "abc", "exp": time.time() + 10}
+        self.assertTrue(self.cache.set("token", claims))
+        self.assertEqual(self.cache.get("token"), claims)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 0))
+
+    def test_without_expiry(self):
+        self.assertFalse(self.cache.set("token", {"sub": "abc"}))
+        self.assertIsNone(self.cache.get("token"))
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_expired(self):
+        self.cache.set("token", {"sub": "abc", "exp": time.time() - 1})
+        self.assertIsNone(self.cache.get("token"))
+
+
+class FlaskJwtDecodeCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask(__name__)
+        self.cache = SharedTokenCache(slots=16)
+        self.jwt = FlaskJwt("secret", 60, decode_cache=self.cache)
+        self.token = self.jwt.encode({"sub": "abc"})
+
+    def test_decodes_once(self):
+        with unittest.mock.patch.object(
+            self.jwt, "decode", unittest.mock.Mock(wraps=self.jwt.decode)
+        ) as decode:
+            first = self.jwt.decode_request_token(self.token)
+            second = self.jwt.decode_request_token(self.token)
+        self.assertEqual(first, second)
+        decode.assert_called_once_with(self.token, True)
+
+    def test_not_used_without_verification(self):
+        self.jwt.verify = False
+        self.jwt.decode_request_token(self.token)
+        self.assertIsNone(self.cache.get(self.token))
+
+    def test_pre_request_callback(self):
+        headers = {"Authorization": f"Bearer {self.token}"}
+        with self.app.app_context(), unittest.mock.patch(
+            "flask.request", unittest.mock.Mock(headers=headers)
+        ):
+            self.jwt.pre_request_callback()
+            self.assertEqual(self.jwt.current_token()["sub"], "abc")
+        self.assertEqual(self.cache.get(self.token)["sub"], "abc")
@@ -0,0 +1,150 @@
+import unittest
+
+import flask
+import werkzeug.datastructures
+
+import flapi.schema.errors
+import flapi.schema.types
+from flapi.schema.coercion import Coercer
+from flapi.schema.protect import Protect
+
+
+class Page(flapi.schema.types.Schema):
+    page = flapi.schema.types.Int(min_value=1, default=1)
+    ratio = flapi.schema.types.Number()
+    exact = flapi.schema.types.Bool()
+    tag = flapi.schema.types.Array(flapi.schema.types.String())
+
+
+class StrictPage(flapi.schema.types.Schema):
+    __strict__ = True
+    page = flapi.schema.types.Int()
+
+
+class Headers(flapi.schema.types.Schema):
+    x_request_id = flapi.schema.types.Uuid(nullable=False)
+
+
+class ItemId(flapi.schema.types.Schema):
+    id = flapi.schema.types.Int(nullable=False)
+
+
+def args(*pairs):
+    return werkzeug.datastructures.MultiDict(pairs)
+
+
+class CoercerTest(unittest.TestCase):
+    def test_coerce(self):
+        coercer = Coercer(Page)
+        self.assertEqual(
+            coercer(args(("page", "3"), ("ratio", "0.5"), ("exact", "yes"))),
+            {"page": 3, "ratio": 0.5, "exact": True, "tag": []},
+        )
+
+    def test_defaults_and_empty(self):
+        coercer = Coercer(Page)
+        self.assertEqual(
+            coercer(args(("page", ""), ("exact", ""))),
+            {"page": 1, "ratio": None, "exact": None, "tag": []},
+        )
+
+    def test_many(self):
+        coercer = Coercer(Page)
+        self.assertEqual(coercer(args(("tag", "a"), ("tag", "b")))["tag"], ["a", "b"])
+
+    def test_many_plain_dict(self):
+        coercer = Coercer(Page)
+        self.assertEqual(coercer({"tag": "a"})["tag"], ["a"])
+        self.assertEqual(coercer({})["tag"], [])
+
+    def test_invalid(self):
+        coercer = Coercer(Page)
+        with self.assertRaisesRegex(flapi.schema.errors.SchemaValidationError, "page"):
+            coercer(args(("page", "three")))
+        with self.assertRaisesRegex(flapi.schema.errors.SchemaValidationError, "exact"):
+            coercer(args(("exact", "maybe")))
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError, coercer, args(("page", "0"))
+        )
+
+    def test_strict(self):
+        coercer = Coercer(StrictPage)
+        self.assertEqual(coercer(args(("page", "2"))), {"page": 2})
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError, coercer, args(("other", "1"))
+        )
+        self.assertEqual(Coercer(Page)(args(("other", "1")))["page"], 1)
+
+    def test_headers(self):
+        coercer = Coercer(Headers, headers=True)
+        headers = werkzeug.datastructures.Headers(
+            {"X-Request-Id": "123e4567-e89b-12d3-a456-426655440000", "Host": "x"}
+        )
+        self.assertEqual(
+            str(coercer(headers)["x_request_id"]),
+            "123e4567-e89b-12d3-a456-426655440000",
+        )
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError,
+            coercer,
+            werkzeug.datastructures.Headers(),
+        )
+
+
+class ProtectSourcesTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask(__name__)
+        self.app.testing = True
+
+        @self.app.route("/items/<id>", methods=["GET", "POST"])
+        @Protect(None, args=Page, form=StrictPage, headers=Headers, view_args=ItemId)
+        def items(body, id, args, form, headers):
+            return flask.jsonify(
+                id=id, page=args["page"], tag=args["tag"], form=form["page"]
+            )
+
+        self.client = self.app.test_client()
+        self.headers = {"X-Request-Id": "123e4567-e89b-12d3-a456-426655440000"}
+
+    def test_sources(self):
+        response = self.client.post(
+            "/items/4?page=2&tag=a&tag=b", data={"page": "5"}, headers=self.headers
+        )
+        self.assertEqual(
+            response.get_json(), {"id": 4, "page": 2, "tag": ["a", "b"], "form": 5}
+        )
+
+    def test_record_view_args(self):
+        class RecordId(ItemId):
+            __record__ = True
+
+        @self.app.route("/records/<id>")
+        @Protect(None, view_args=RecordId)
+        def records(body, id):
+            return flask.jsonify(id=id)
+
+        self.assertEqual(self.client.get("/records/4").get_json(), {"id": 4})
+
+    def test_strict_view_args_with_args(self):
+        class StrictId(ItemId):
+            __strict__ = True
+
+        @self.app.route("/strict/<id>")
+        @Protect(None, args=Page, view_args=StrictId)
+        def strict(body, id, args):
+            return flask.jsonify(id=id, page=args["page"])
+
+        self.assertEqual(
+            self.client.get("/strict/3?page=2").get_json(), {"id": 3, "page": 2}
+        )
+
+    def test_invalid_source(self):
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError,
+            self.client.get,
+            "/items/four",
+            headers=self.headers,
+        )
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError, self.client.get, "/items/4"
+        )
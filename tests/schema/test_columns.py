@@ -0,0 +1,77 @@
+import array
+import unittest
+import unittest.mock
+
+import flapi.schema.errors
+import flapi.schema.types
+from flapi.schema import columns
+
+
+class Row(flapi.schema.types.Schema):
+    __strict__ = True
+    id = flapi.schema.types.Int(nullable=False)
+    score = flapi.schema.types.Float()
+    active = flapi.schema.types.Bool(default=False)
+    name = flapi.schema.types.String()
+
+
+class ColumnsTest(unittest.TestCase):
+    def setUp(self):
+        patcher = unittest.mock.patch.object(columns, "_numpy", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.prop = flapi.schema.types.Array(Row, columnar=True)
+
+    def test_columns(self):
+        value = self.prop(
+            [
+                {"id": 1, "score": 0.5, "active": True, "name": "a"},
+                {"id": 2, "score": 1, "name": "b"},
+            ]
+        )
+        self.assertEqual(value["id"], array.array("q", [1, 2]))
+        self.assertEqual(value["score"], array.array("d", [0.5, 1.0]))
+        self.assertEqual(value["active"], array.array("b", [1, 0]))
+        self.assertEqual(value["name"], ["a", "b"])
+
+    def test_empty(self):
+        value = self.prop([])
+        self.assertEqual(value["id"], array.array("q"))
+        self.assertEqual(value["name"], [])
+
+    def test_null_values_fall_back_to_lists(self):
+        value = self.prop([{"id": 1, "active": True}, {"id": 2, "score": 2.5}])
+        self.assertEqual(value["score"], [None, 2.5])
+        self.assertEqual(value["active"], array.array("b", [1, 0]))
+
+    def test_bools_stay_bools_after_fall_back(self):
+        column = columns.Column(None, ("b", bool))
+        column.append(True)
+        column.append(None)
+        self.assertEqual(column.finish(), [True, None])
+
+    def test_large_ints_fall_back_to_lists(self):
+        value = self.prop([{"id": 1}, {"id": 2**70}])
+        self.assertEqual(value["id"], [1, 2**70])
+
+    def test_validation_errors(self):
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError, self.prop, [{"id": "a"}]
+        )
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError, self.prop, [{"other": 1}]
+        )
+        self.assertRaises(flapi.schema.errors.SchemaValidationError, self.prop, [None])
+
+    def test_requires_object(self):
+        self.assertRaises(
+            ValueError, flapi.schema.types.Array, flapi.schema.types.Int, columnar=True
+        )
+
+    def test_numpy(self):
+        numpy = unittest.mock.Mock()
+        with unittest.mock.patch.object(columns, "_numpy", numpy):
+            value = self.prop([{"id": 1, "name": "a"}])
+        numpy.asarray.assert_any_call(array.array("q", [1]), dtype="int64")
+        self.assertIs(value["id"], numpy.asarray.return_value)
+        self.assertEqual(value["name"], ["a"])
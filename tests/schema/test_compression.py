@@ -0,0 +1,156 @@
+import gzip
+import io
+import json
+import unittest
+import unittest.mock
+import zlib
+
+import flask
+
+import flapi.schema.errors
+import flapi.schema.protect
+import flapi.schema.types
+from flapi.schema import compression
+from flapi.schema.compression import DecompressingStream
+
+
+class Record(flapi.schema.types.Schema):
+    id = flapi.schema.types.Int(nullable=False)
+
+
+lines = b"".join(b'{"id": %d}\n' % i for i in range(1000))
+
+
+def stream(data, encoding="gzip", max_size=1 << 20):
+    return DecompressingStream(io.BytesIO(data), encoding, max_size)
+
+
+class DecompressingStreamTest(unittest.TestCase):
+    def test_read_gzip(self):
+        self.assertEqual(stream(gzip.compress(lines)).read(), lines)
+
+    def test_read_deflate(self):
+        self.assertEqual(stream(zlib.compress(lines), "deflate").read(), lines)
+
+    def test_read_sizes(self):
+        body = stream(gzip.compress(lines))
+        self.assertEqual(body.read(5), lines[:5])
+        self.assertEqual(body.read(0), b"")
+        self.assertEqual(body.read(), lines[5:])
+        self.assertEqual(body.read(), b"")
+
+    def test_readline(self):
+        body = stream(gzip.compress(lines))
+        self.assertEqual(body.readline(), b'{"id": 0}\n')
+        self.assertEqual(body.readline(4), b'{"id')
+        self.assertEqual(body.readline(100), b'": 1}\n')
+        self.assertEqual(list(iter(body.readline, b"")), lines.splitlines(True)[2:])
+
+    def test_max_size(self):
+        bomb = gzip.compress(b" " * (64 << 20))
+        body = stream(bomb, max_size=1 << 20)
+        with self.assertRaisesRegex(
+            flapi.schema.errors.SchemaValidationError, "larger than"
+        ):
+            body.read()
+        self.assertLess(body.size, 2 << 20)
+
+    def test_invalid(self):
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError, stream(b"nope").read
+        )
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError,
+            stream(gzip.compress(lines)[:100]).read,
+        )
+
+    def test_unsupported(self):
+        self.assertRaises(flapi.schema.errors.SchemaValidationError, stream, b"", "br")
+
+    def test_zstd(self):
+        zstandard = compression._zstandard()
+        if zstandard is None:
+            self.assertRaises(
+                flapi.schema.errors.SchemaValidationError, stream, b"", "zstd"
+            )
+        else:
+            data = zstandard.ZstdCompressor().compress(lines)
+            self.assertEqual(stream(data, "zstd").read(), lines)
+            for corrupt in (b"nope", data[:4] + b"x" * 20):
+                self.assertRaises(
+                    flapi.schema.errors.SchemaValidationError,
+                    stream(corrupt, "zstd").read,
+                )
+
+    def test_zstd_error(self):
+        class ZstdError(Exception):
+            pass
+
+        def read(size):
+            raise ZstdError("corrupt")
+
+        zstandard = unittest.mock.Mock(ZstdError=ZstdError)
+        zstandard.ZstdDecompressor().stream_reader().read = read
+        with unittest.mock.patch.object(
+            compression, "_zstandard", return_value=zstandard
+        ):
+            body = stream(b"nope", "zstd")
+        with self.assertRaisesRegex(
+            flapi.schema.errors.SchemaValidationError, "invalid zstd body"
+        ):
+            body.read()
+
+    def test_content_encoding(self):
+        def request(**headers):
+            return unittest.mock.Mock(headers=headers)
+
+        self.assertEqual(
+            compression.content_encoding(request(**{"Content-Encoding": " GZIP"})),
+            "gzip",
+        )
+        self.assertIsNone(
+            compression.content_encoding(request(**{"Content-Encoding": "identity"}))
+        )
+        self.assertIsNone(compression.content_encoding(request()))
+        self.assertIsNone(compression.content_encoding(unittest.mock.Mock()))
+
+
+class CompressedRequestTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask(__name__)
+        self.app.testing = True
+
+        @self.app.route("/", methods=["POST"])
+        @flapi.schema.protect(Record, max_decompressed=1 << 16)
+        def view(record):
+            return record
+
+        @self.app.route("/lines", methods=["POST"])
+        @flapi.schema.protect(Record, ndjson=True)
+        def lines_view(records):
+            return {"count": sum(1 for _ in records)}
+
+    def post(self, path, data, content_type="application/json", encoding="gzip"):
+        return self.app.test_client().post(
+            path,
+            data=data,
+            content_type=content_type,
+            headers={"Content-Encoding": encoding},
+        )
+
+    def test_json(self):
+        response = self.post("/", gzip.compress(json.dumps({"id": 3}).encode()))
+        self.assertEqual(response.get_json(), {"id": 3})
+
+    def test_ndjson(self):
+        response = self.post("/lines", gzip.compress(lines), "application/x-ndjson")
+        self.assertEqual(response.get_json(), {"count": 1000})
+
+    def test_too_large(self):
+        body = gzip.compress(json.dumps({"id": 3, "pad": " " * (1 << 17)}).encode())
+        with self.assertRaises(flapi.schema.errors.SchemaValidationError):
+            self.post("/", body)
+
+    def test_invalid_json(self):
+        response = self.post("/", gzip.compress(b"{"))
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,130 @@
+import datetime
+import json
+import unittest
+import unittest.mock
+
+import flask
+
+import flapi.schema.errors
+import flapi.schema.protect
+import flapi.schema.types
+from flapi.schema.decoding import Decoder
+
+
+class Item(flapi.schema.types.Schema):
+    name = flapi.schema.types.String(min_length=1, nullable=False)
+    when = flapi.schema.types.Date()
+    count = flapi.schema.types.Int(default=0)
+
+
+class Thing(flapi.schema.types.Schema):
+    __strict__ = True
+    id = flapi.schema.types.Uuid(nullable=False)
+    items = flapi.schema.types.Array(flapi.schema.types.Object(Item))
+    scores = flapi.schema.types.Array(flapi.schema.types.Float(min_value=0))
+    extra = flapi.schema.types.Object(Item, callback=lambda value: value)
+    choice = flapi.schema.types.Choice([1, flapi.schema.types.String()])
+
+    @flapi.schema.types.CustomProperty(int)
+    def doubled(cls, value):
+        return None if value is None else value * 2
+
+
+body = {
+    "id": "c4a9f1ba-1c1b-4b2e-8b41-6c2c8b0c4c6d",
+    "items": [{"name": "a", "when": "2019-01-01"}],
+    "scores": [0.5, 1],
+    "extra": {"name": "b"},
+    "choice": "some",
+    "doubled": 2,
+}
+
+
+class DecoderTest(unittest.TestCase):
+    def setUp(self):
+        self.schema = Thing()
+        self.decoder = Decoder(self.schema)
+
+    def assertDecodes(self, value):
+        expected = self.schema(json.loads(json.dumps(value)))
+        for separators in ((",", ":"), (" , ", " : ")):
+            text = json.dumps(value, separators=separators)
+            self.assertEqual(self.decoder.decode(f" {text}\n"), expected)
+
+    def test_matches_validation(self):
+        self.assertDecodes(body)
+        self.assertEqual(
+            self.decoder.decode(json.dumps(body))["items"][0]["when"],
+            datetime.date(2019, 1, 1),
+        )
+
+    def test_empty_and_missing(self):
+        self.assertDecodes({"id": body["id"], "items": [], "extra": None})
+        self.assertDecodes({"id": body["id"], "items": [{"name": "x"}]})
+
+    def test_bytes(self):
+        self.assertEqual(
+            self.decoder.decode(json.dumps(body).encode("utf-16")),
+            self.decoder.decode(json.dumps(body)),
+        )
+
+    def test_record(self):
+        decoder = Decoder(flapi.schema.types.Object(Item, record=True))
+        value = decoder.decode('{"name": "a", "count": 3}')
+        self.assertEqual((value.name, value.when, value.count), ("a", None, 3))
+
+    def test_invalid_values(self):
+        for change in (
+            {"id": "nope"},
+            {"items": [{"name": ""}]},
+            {"items": [{"when": "2019-13-01"}]},
+            {"scores": [-1]},
+            {"items": {}},
+            {"doubled": "2"},
+        ):
+            text = json.dumps(dict(body, **change))
+            self.assertRaises(
+                flapi.schema.errors.SchemaValidationError, self.decoder.decode, text
+            )
+
+    def test_strict_rejects_extra_field_before_parsing_it(self):
+        text = '{"id": "c4a9f1ba1c1b4b2e8b416c2c8b0c4c6d", "other": [not json'
+        with self.assertRaisesRegex(
+            flapi.schema.errors.SchemaValidationError, "extra fields"
+        ):
+            self.decoder.decode(text)
+
+    def test_invalid_json(self):
+        for text in ("", "{", '{"id" 1}', '{"id": 1,}', "{} {}", "[1, 2", "nul"):
+            self.assertRaises(
+                flapi.schema.errors.SchemaValidationError, self.decoder.decode, text
+            )
+
+
+class PartialDecoderTest(unittest.TestCase):
+    def test_partial(self):
+        decoder = Decoder(Item(partial=True))
+        self.assertEqual(decoder.decode('{"count": 3}'), {"count": 3})
+        self.assertEqual(decoder.decode("{}"), {})
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError, decoder.decode, '{"name": ""}'
+        )
+
+
+class DecodeProtectTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask(__name__)
+        self.app.testing = True
+
+        @self.app.route("/", methods=["POST"])
+        @flapi.schema.protect(Thing, decode=True)
+        def view(value):
+            return {"items": len(value["items"]), "doubled": value["doubled"]}
+
+    def test_decodes_request(self):
+        response = self.app.test_client().post("/", json=body)
+        self.assertEqual(response.get_json(), {"items": 1, "doubled": 4})
+
+    def test_rejects_request(self):
+        with self.assertRaises(flapi.schema.errors.SchemaValidationError):
+            self.app.test_client().post("/", data="{", content_type="application/json")
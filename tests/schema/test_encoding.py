@@ -0,0 +1,95 @@
+import array
+import datetime
+import json
+import unittest
+
+import flask
+
+import flapi.schema.types
+from flapi.schema.encoding import Encoder
+
+
+class Item(flapi.schema.types.Schema):
+    name = flapi.schema.types.String()
+    when = flapi.schema.types.Date()
+
+
+class Thing(flapi.schema.types.Schema):
+    id = flapi.schema.types.Int()
+    created_at = flapi.schema.types.DateTime()
+    items = flapi.schema.types.Array(flapi.schema.types.Object(Item))
+    record = flapi.schema.types.Object(Item, record=True)
+    scores = flapi.schema.types.Array(flapi.schema.types.Int(), packed=True)
+    choice = flapi.schema.types.Choice([flapi.schema.types.Date()])
+
+
+created_at = datetime.datetime(2019, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+
+value = {
+    "choice": datetime.date(2019, 1, 3),
+    "created_at": created_at,
+    "id": 1,
+    "items": [{"name": "a", "when": datetime.date(2019, 1, 1)}, None],
+    "record": flapi.schema.types.record_class(Item)("b", None),
+    "scores": array.array("q", [1, 2]),
+}
+
+
+class EncoderTest(unittest.TestCase):
+    def test_encode(self):
+        self.assertEqual(
+            json.loads(Encoder(Thing).encode(value)),
+            {
+                "choice": "2019-01-03",
+                "created_at": "2019-01-02T03:04:05.000000+00:00",
+                "id": 1,
+                "items": [{"name": "a", "when": "2019-01-01"}, None],
+                "record": {"name": "b", "when": None},
+                "scores": [1, 2],
+            },
+        )
+
+    def test_does_not_modify_value(self):
+        items = [{"name": "a", "when": datetime.date(2019, 1, 1)}]
+        Encoder(Thing).encode({"items": items})
+        self.assertEqual(items[0]["when"], datetime.date(2019, 1, 1))
+
+    def test_round_trip(self):
+        encoded = Encoder(Thing).encode(value)
+        decoded = Thing()(json.loads(encoded))
+        self.assertEqual(decoded["created_at"], created_at)
+        self.assertEqual(decoded["items"][0]["when"], datetime.date(2019, 1, 1))
+
+    def test_nothing_to_convert(self):
+        encoder = Encoder(flapi.schema.types.Array(flapi.schema.types.String))
+        self.assertIsNone(encoder.prepare)
+        self.assertEqual(encoder.encode(["a", None]), '["a",null]')
+
+    def test_unserializable(self):
+        self.assertRaises(TypeError, Encoder(Thing).encode, {"id": object()})
+
+
+class EncoderResponseTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask(__name__)
+
+        @self.app.route("/")
+        @Encoder(Item)
+        def view():
+            return {"name": "a", "when": datetime.date(2019, 1, 1)}
+
+        @self.app.route("/created")
+        @Encoder(Item)
+        def created():
+            return {"name": "b"}, 201, {"X-Thing": "1"}
+
+    def test_response(self):
+        response = self.app.test_client().get("/")
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.get_json(), {"name": "a", "when": "2019-01-01"})
+
+    def test_status_and_headers(self):
+        response = self.app.test_client().get("/created")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.headers["X-Thing"], "1")
+        self.assertEqual(response.get_json(), {"name": "b"})
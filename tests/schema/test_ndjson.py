@@ -0,0 +1,88 @@
+import io
+import json
+import unittest
+
+import flask
+
+import flapi.schema.errors
+import flapi.schema.protect
+import flapi.schema.types
+from flapi.schema.protect import Protect
+
+
+class Record(flapi.schema.types.Schema):
+    __strict__ = True
+    id = flapi.schema.types.Int(nullable=False)
+    when = flapi.schema.types.Date()
+
+
+def ndjson(*records):
+    return "".join(json.dumps(record) + "\n" for record in records).encode()
+
+
+class NdjsonTest(unittest.TestCase):
+    def setUp(self):
+        self.protect = Protect(Record, ndjson=True, max_line=64)
+
+    def records(self, data, protect=None):
+        return list((protect or self.protect)._lines(io.BytesIO(data)))
+
+    def test_records(self):
+        records = self.records(ndjson({"id": 1, "when": "2019-01-01"}, {"id": 2}))
+        self.assertEqual([record["id"] for record in records], [1, 2])
+        self.assertEqual(str(records[0]["when"]), "2019-01-01")
+
+    def test_blank_lines_and_missing_newline(self):
+        records = self.records(b'\n{"id": 1}\n\n{"id": 2}')
+        self.assertEqual([record["id"] for record in records], [1, 2])
+
+    def test_invalid_record(self):
+        with self.assertRaises(flapi.schema.errors.LineValidationError) as context:
+            self.records(ndjson({"id": 1}, {"id": 1}, {"id": "x"}))
+        self.assertEqual(context.exception.line, 3)
+        self.assertTrue(str(context.exception).startswith("line 3: "))
+
+    def test_invalid_json(self):
+        with self.assertRaises(flapi.schema.errors.LineValidationError) as context:
+            self.records(b'{"id": 1}\n\n{"id": \n')
+        self.assertEqual(context.exception.line, 3)
+
+    def test_line_too_long(self):
+        with self.assertRaisesRegex(
+            flapi.schema.errors.LineValidationError, "line 2: line is longer"
+        ):
+            self.records(ndjson({"id": 1}, {"id": 1, "extra": "x" * 100}))
+
+    def test_lazy(self):
+        records = self.protect._lines(io.BytesIO(ndjson({"id": 1}, {"id": "x"})))
+        self.assertEqual(next(records)["id"], 1)
+        self.assertRaises(flapi.schema.errors.LineValidationError, next, records)
+
+    def test_decoder(self):
+        protect = Protect(Record, ndjson=True, decode=True)
+        records = self.records(ndjson({"id": 1}), protect)
+        self.assertEqual(records, [{"id": 1, "when": None}])
+        with self.assertRaises(flapi.schema.errors.LineValidationError):
+            self.records(ndjson({"id": 1, "other": 2}), protect)
+
+    def test_requires_schema(self):
+        self.assertRaises(ValueError, Protect, True, ndjson=True)
+
+
+class NdjsonRequestTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask(__name__)
+        self.app.testing = True
+
+        @self.app.route("/", methods=["POST"])
+        @flapi.schema.protect(Record, ndjson=True)
+        def view(records):
+            return {"ids": [record["id"] for record in records]}
+
+    def test_request(self):
+        response = self.app.test_client().post(
+            "/",
+            data=ndjson(*({"id": i} for i in range(100))),
+            content_type="application/x-ndjson",
+        )
+        self.assertEqual(response.get_json(), {"ids": list(range(100))})
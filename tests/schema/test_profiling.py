@@ -0,0 +1,110 @@
+import threading
+import unittest
+import unittest.mock
+
+import flask
+
+import flapi.schema.protect
+import flapi.schema.types
+from flapi.schema.profiling import Profiler, profiler
+
+
+class Item(flapi.schema.types.Schema):
+    name = flapi.schema.types.String()
+    created_at = flapi.schema.types.Date()
+
+
+class Thing(flapi.schema.types.Schema):
+    items = flapi.schema.types.Array(flapi.schema.types.Object(Item))
+    count = flapi.schema.types.Int(callback=lambda value: value)
+
+    @flapi.schema.types.CustomProperty(int)
+    def doubled(cls, value):
+        return value * 2
+
+
+class ProfilerTest(unittest.TestCase):
+    def setUp(self):
+        profiler.clear()
+        self.addCleanup(profiler.disable)
+        self.addCleanup(profiler.clear)
+        self.value = {
+            "items": [
+                {"name": "a", "created_at": "2019-01-01"},
+                {"name": "b", "created_at": "2019-01-02"},
+            ],
+            "count": 2,
+            "doubled": 1,
+        }
+
+    def paths(self):
+        return {path: calls for path, _, calls in profiler.report()}
+
+    def test_inactive_by_default(self):
+        self.assertFalse(profiler.active)
+        Thing()(self.value)
+        self.assertEqual(profiler.report(), [])
+
+    def test_profile(self):
+        with profiler.profile():
+            self.assertTrue(profiler.active)
+            result = Thing()(self.value)
+        self.assertFalse(profiler.active)
+        self.assertEqual(result["doubled"], 2)
+        self.assertEqual(
+            self.paths(),
+            {
+                "/items": 1,
+                "/items/*": 2,
+                "/items/*/name": 2,
+                "/items/*/created_at": 2,
+                "/count": 1,
+                "/count#callback": 1,
+                "/doubled": 1,
+                "/doubled#custom": 1,
+            },
+        )
+
+    def test_report_ranked(self):
+        with profiler.profile():
+            Thing()(self.value)
+        report = profiler.report()
+        self.assertEqual(report[0][0], "/items")
+        self.assertEqual(
+            [row[1] for row in report], sorted((row[1] for row in report), reverse=True)
+        )
+        self.assertEqual(len(profiler.report(limit=2)), 2)
+
+    def test_nested_profile(self):
+        with profiler.profile():
+            with profiler.profile():
+                pass
+            self.assertTrue(profiler.active)
+
+    def test_other_threads_unaffected(self):
+        seen = []
+        with profiler.profile():
+            thread = threading.Thread(target=lambda: seen.append(profiler.active))
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, [False])
+
+    def test_sample(self):
+        local = Profiler()
+        with local.sample():
+            self.assertFalse(local.active)
+        local.enable(sample_rate=1)
+        with local.sample():
+            self.assertTrue(local.active)
+        local.enable(sample_rate=0)
+        with local.sample():
+            self.assertFalse(local.active)
+
+    def test_schema_protect_samples(self):
+        profiler.enable()
+        protected = flapi.schema.protect(Thing)(lambda body: body)
+        with unittest.mock.patch.object(
+            flask, "request", unittest.mock.Mock(json=self.value)
+        ):
+            protected()
+        self.assertIn("/items/*/created_at", self.paths())
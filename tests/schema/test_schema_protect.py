@@ -73,3 +73,20 @@ class SchemaProtectTest(unittest.TestCase):
     def test_wrong_type(self):
         func = flapi.schema.protect(123)(route)
         self.assertRaises(flapi.schema.errors.SchemaValidationError, func)
+
+    @unittest.mock.patch.object(flask, "request", unittest.mock.Mock(json={}))
+    def test_partial(self):
+        class PatchSchema(FakeSchema):
+            other = flapi.schema.types.Int(nullable=False)
+
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError,
+            flapi.schema.protect(PatchSchema)(route),
+        )
+        func = flapi.schema.protect(PatchSchema, partial=True)(route)
+        self.assertEqual(func(), {})
+
+    def test_partial_requires_schema(self):
+        self.assertRaises(
+            ValueError, flapi.schema.protect, flapi.schema.types.Int(), partial=True
+        )
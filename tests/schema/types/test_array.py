@@ -1,5 +1,9 @@
+import array
 import unittest
+import unittest.mock
 
+import flapi.schema
+import flapi.schema.columns
 import flapi.schema.errors
 import flapi.schema.types
 
@@ -66,3 +70,61 @@ class ArrayTest(unittest.TestCase):
     def test_no_callback(self):
         prop = flapi.schema.types.Array(BasicSchema, callback=None)
         self.assertEqual(prop([{"thing": False}]), [{"thing": False}])
+
+    def test_bulk_numbers(self):
+        prop = flapi.schema.types.Array(
+            flapi.schema.types.Float(min_value=0, max_value=1)
+        )
+        self.assertIsNotNone(prop.bulk)
+        self.assertEqual(prop([0, 0.5, 1, True]), [0, 0.5, 1, True])
+
+    def test_bulk_numbers_out_of_range(self):
+        prop = flapi.schema.types.Array(
+            flapi.schema.types.Float(min_value=0, max_value=1)
+        )
+        for value in ([0.5, 1.5], [-0.5, 0.5], [0.5, float("nan")], [0.5, "1"]):
+            self.assertRaises(flapi.schema.errors.SchemaValidationError, prop, value)
+
+    def test_bulk_large_int(self):
+        prop = flapi.schema.types.Array(flapi.schema.types.Float(min_value=0))
+        self.assertEqual(prop([0.5, 10**400]), [0.5, 10**400])
+        prop = flapi.schema.types.Array(flapi.schema.types.Float(max_value=1))
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError, prop, [0.5, 10**400]
+        )
+
+    def test_bulk_nullable(self):
+        prop = flapi.schema.types.Array(flapi.schema.types.Int(min_value=0))
+        self.assertEqual(prop([1, None]), [1, None])
+        prop = flapi.schema.types.Array(flapi.schema.types.Int(nullable=False))
+        self.assertRaises(flapi.schema.errors.SchemaValidationError, prop, [1, None])
+
+    def test_bulk_not_used(self):
+        for schema in (
+            flapi.schema.types.Int(callback=lambda v: v),
+            flapi.schema.types.Int(default=1),
+            flapi.schema.types.Int(min_value=lambda: 0),
+            flapi.schema.types.String(),
+        ):
+            self.assertIsNone(flapi.schema.types.Array(schema).bulk)
+
+    def test_packed(self):
+        prop = flapi.schema.types.Array(flapi.schema.types.Int(), packed=True)
+        with unittest.mock.patch.object(flapi.schema.columns, "_numpy", False):
+            self.assertEqual(prop([1, 2]), array.array("q", [1, 2]))
+            self.assertEqual(prop([1, None]), [1, None])
+
+    def test_packed_profiled(self):
+        prop = flapi.schema.types.Array(flapi.schema.types.Float(), packed=True)
+        self.addCleanup(flapi.schema.profiler.clear)
+        with unittest.mock.patch.object(flapi.schema.columns, "_numpy", False):
+            with flapi.schema.profiler.profile():
+                self.assertEqual(prop([0.5, 1.5]), array.array("d", [0.5, 1.5]))
+
+    def test_packed_requires_numbers(self):
+        self.assertRaises(
+            ValueError,
+            flapi.schema.types.Array,
+            flapi.schema.types.String(),
+            packed=True,
+        )
@@ -42,3 +42,63 @@ class ObjectTest(unittest.TestCase):
     def test_no_callback(self):
         prop = flapi.schema.types.Object(BasicSchema, callback=None)
         self.assertEqual(prop({"thing": False}), {"thing": False})
+
+    def test_fields_resolved_once_per_schema(self):
+        first = flapi.schema.types.Object(BasicSchema)
+        second = flapi.schema.types.Object(BasicSchema)
+        self.assertIn(BasicSchema, flapi.schema.types._fields)
+        self.assertEqual(first.schema, second.schema)
+        self.assertIsNot(first.schema, second.schema)
+        self.assertIs(first.schema["thing"], second.schema["thing"])
+
+    def test_record(self):
+        prop = flapi.schema.types.Object(BasicSchema, record=True)
+        value = prop({"thing": False})
+        self.assertIsInstance(value, flapi.schema.types.Record)
+        self.assertFalse(value.thing)
+        self.assertFalse(hasattr(value, "__dict__"))
+        self.assertEqual(value._asdict(), {"thing": False})
+        self.assertEqual(repr(value), "BasicSchemaRecord(thing=False)")
+
+    def test_record_class_generated_once(self):
+        first = flapi.schema.types.Object(BasicSchema, record=True)
+        second = flapi.schema.types.Object(BasicSchema, record=True)
+        self.assertIs(first.record, second.record)
+        self.assertEqual(first({"thing": True}), second({"thing": True}))
+
+    def test_record_from_schema(self):
+        class RecordSchema(BasicSchema):
+            __record__ = True
+
+        value = RecordSchema()({"thing": True})
+        self.assertIs(type(value), flapi.schema.types.record_class(RecordSchema))
+        self.assertTrue(value.thing)
+
+    def test_partial(self):
+        class PatchSchema(flapi.schema.types.Schema):
+            name = flapi.schema.types.String(nullable=False)
+            count = flapi.schema.types.Int(default=0)
+
+        prop = flapi.schema.types.Object(PatchSchema, partial=True)
+        self.assertEqual(prop({"count": 2}), {"count": 2})
+        self.assertEqual(prop({}), {})
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError, prop, {"name": None}
+        )
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError, prop, {"count": "two"}
+        )
+
+    def test_partial_schema(self):
+        class PatchSchema(BasicSchema):
+            __record__ = True
+
+        self.assertEqual(PatchSchema(partial=True)({}), {})
+        self.assertEqual(PatchSchema(partial=True)({"thing": True}), {"thing": True})
+        self.assertIsInstance(PatchSchema()({}), flapi.schema.types.Record)
+
+    def test_partial_strict(self):
+        prop = flapi.schema.types.Object(BasicSchema, strict=True, partial=True)
+        self.assertRaises(
+            flapi.schema.errors.SchemaValidationError, prop, {"other": 12}
+        )
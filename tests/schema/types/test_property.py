@@ -44,3 +44,94 @@ class PropertyTest(unittest.TestCase):
     def test_no_callback(self):
         prop = flapi.schema.types.Property(int, callback=None)
         self.assertEqual(prop(12), 12)
+
+
+class InternPropertyTest(unittest.TestCase):
+    def test_identical_properties_are_shared(self):
+        first = flapi.schema.types.String(max_length=255, nullable=False)
+        second = flapi.schema.types.String(max_length=255, nullable=False)
+        self.assertIs(
+            flapi.schema.types.intern_property(first),
+            flapi.schema.types.intern_property(second),
+        )
+
+    def test_different_properties_are_not_shared(self):
+        first = flapi.schema.types.intern_property(flapi.schema.types.Int(min_value=1))
+        self.assertIsNot(
+            first, flapi.schema.types.intern_property(flapi.schema.types.Int())
+        )
+        self.assertIsNot(
+            first,
+            flapi.schema.types.intern_property(flapi.schema.types.Int(min_value=True)),
+        )
+        self.assertIsNot(
+            first,
+            flapi.schema.types.intern_property(flapi.schema.types.Float(min_value=1)),
+        )
+
+    def test_array_children_are_shared(self):
+        first = flapi.schema.types.intern_property(
+            flapi.schema.types.Array(flapi.schema.types.Uuid)
+        )
+        second = flapi.schema.types.intern_property(
+            flapi.schema.types.Array(flapi.schema.types.Uuid())
+        )
+        self.assertIs(first, second)
+
+    def test_shared_properties_are_immutable(self):
+        class First(flapi.schema.types.Schema):
+            name = flapi.schema.types.String(max_length=10)
+
+        class Second(flapi.schema.types.Schema):
+            name = flapi.schema.types.String(max_length=10)
+
+        First(), Second()
+        self.assertIs(First.name, Second.name)
+        with self.assertRaises(AttributeError):
+            Second.name.nullable = False
+        with self.assertRaises(AttributeError):
+            Second.name.range.max = 5
+        self.assertEqual(First()({}), {"name": None})
+        self.assertEqual(First()({"name": "x" * 10}), {"name": "x" * 10})
+
+    def test_unshared_properties_are_mutable(self):
+        class Only(flapi.schema.types.Schema):
+            name = flapi.schema.types.String(max_length=12345)
+
+        Only()
+        Only.name.nullable = False
+        self.assertRaises(flapi.schema.errors.SchemaValidationError, Only(), {})
+
+    def test_modified_properties_are_not_shared(self):
+        class First(flapi.schema.types.Schema):
+            name = flapi.schema.types.String(max_length=23456)
+
+        First()
+        First.name.nullable = False
+
+        class Second(flapi.schema.types.Schema):
+            name = flapi.schema.types.String(max_length=23456)
+
+        Second()
+        self.assertIsNot(First.name, Second.name)
+        self.assertEqual(Second()({}), {"name": None})
+
+    def test_unslotted_subclass_is_not_shared(self):
+        class Custom(flapi.schema.types.Int):
+            pass
+
+        prop = Custom()
+        self.assertIs(flapi.schema.types.intern_property(prop), prop)
+        self.assertIsNot(
+            flapi.schema.types.intern_property(Custom()),
+            prop,
+        )
+
+    def test_schemas_share_fields(self):
+        class First(flapi.schema.types.Schema):
+            id = flapi.schema.types.Uuid(nullable=False)
+
+        class Second(flapi.schema.types.Schema):
+            id = flapi.schema.types.Uuid(nullable=False)
+
+        self.assertIs(First().object.schema["id"], Second().object.schema["id"])
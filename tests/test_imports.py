@@ -0,0 +1,40 @@
+import subprocess
+import sys
+import unittest
+
+import flapi
+
+
+def loaded_after(statement, *modules):
+    code = f"import sys; {statement}; print(' '.join(m for m in {modules!r} if m in sys.modules))"
+    output = subprocess.check_output([sys.executable, "-c", code])
+    return output.decode().split()
+
+
+class LazyImportTest(unittest.TestCase):
+    def test_flapi_loads_nothing(self):
+        self.assertEqual(
+            loaded_after("import flapi", "flapi.schema", "flapi.jwt", "flask"), []
+        )
+
+    def test_schema_does_not_load_jwt(self):
+        self.assertEqual(
+            loaded_after(
+                "import flapi.schema", "flapi.jwt", "jwt", "cryptography", "jsonpointer"
+            ),
+            [],
+        )
+
+    def test_schema_does_not_load_flask(self):
+        self.assertEqual(loaded_after("import flapi.schema", "flask"), [])
+
+    def test_attributes(self):
+        self.assertEqual(flapi.schema.__name__, "flapi.schema")
+        self.assertEqual(flapi.jwt.__name__, "flapi.jwt")
+        self.assertEqual(flapi.core.__name__, "flapi.core")
+        self.assertIs(flapi.rules, flapi.core.rules)
+        self.assertIn("jwt", dir(flapi))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            flapi.nope